@@ -0,0 +1,180 @@
+# File: benchmarks/run_benchmarks.py
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# ─── Allow importing from srcs/ ───────────────────────────────
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+SRC_DIR      = os.path.join(PROJECT_ROOT, "srcs")
+sys.path.insert(0, SRC_DIR)
+
+from image_utils import load_binary_image_to_array, save_array_to_image
+from wormhole_parser import parse_wormholes_from_color_map
+from game_of_life import GameOfLifeWormhole
+from synthetic import random_grid, random_tunnel_map
+from temporal_tiling import TemporalTiler
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+def measure(fn, repeat):
+    """
+    Run `fn` `repeat` times; return (best wall seconds, peak traced MiB, last result).
+    Peak memory comes from one extra run under tracemalloc (which also sees
+    NumPy allocations); it is kept out of the timed runs because tracing slows
+    Python-heavy phases down considerably.
+    """
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best, peak / (1 << 20), result
+
+def run_size(size, args):
+    """Benchmark every phase on one synthetic size; returns {name: metrics}."""
+    rows = cols = size
+    cells = rows * cols
+    grid = random_grid(rows, cols, args.density, seed=size)
+    h_map = random_tunnel_map(rows, cols, args.portals, seed=size + 1)
+    v_map = random_tunnel_map(rows, cols, args.portals, seed=size + 2)
+    results = {}
+
+    def record(name, seconds, peak_mb, work_cells=None):
+        entry = {"seconds": seconds, "peak_mb": round(peak_mb, 3)}
+        if work_cells:
+            entry["cells_per_second"] = work_cells / seconds if seconds > 0 else float("inf")
+        results[f"{size}/{name}"] = entry
+        rate = f"  {entry['cells_per_second']:.3e} cells/s" if work_cells else ""
+        print(f"  {size:>6} {name:<22} {seconds * 1000:10.2f} ms  {peak_mb:9.2f} MiB{rate}")
+
+    seconds, peak, (h, v) = measure(
+        lambda: (parse_wormholes_from_color_map(h_map), parse_wormholes_from_color_map(v_map)), args.repeat
+    )
+    record("parse", seconds, peak, 2 * cells)
+
+    seconds, peak, _ = measure(lambda: GameOfLifeWormhole(grid, h, v).compile_neighbor_table(), args.repeat)
+    record("compile", seconds, peak, cells)
+
+    for engine in args.engines:
+        gol = GameOfLifeWormhole(grid, h, v, engine=engine)
+        gol.step()  # compile / warm caches outside the timed steps
+        seconds, peak, _ = measure(lambda: gol.simulate(args.generations), args.repeat)
+        record(f"step/{engine}", seconds, peak, cells * args.generations)
+
+    # Same tile kernel at each temporal depth: depth 1 is one pass over the
+    # board per generation, so the ratio shows what staying in cache saves
+    corrections = GameOfLifeWormhole(grid, h, v).compile_wormhole_corrections()
+    for depth in args.temporal_depths:
+        tiler = TemporalTiler(rows, cols, corrections, depth=depth)
+        tiler.advance(grid, depth)
+        seconds, peak, _ = measure(lambda: tiler.advance(grid, args.generations), args.repeat)
+        record(f"step/temporal-depth-{depth}", seconds, peak, cells * args.generations)
+
+    for workers in args.strip_workers:
+        gol = GameOfLifeWormhole(grid, h, v)
+        gol.compile_wormhole_corrections()
+        seconds, peak, _ = measure(lambda: gol.simulate(args.generations, workers=workers), args.repeat)
+        record(f"step/strips-{workers}", seconds, peak, cells * args.generations)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "grid.png")
+        seconds, peak, _ = measure(lambda: save_array_to_image(grid, path), args.repeat)
+        record("save", seconds, peak, cells)
+        seconds, peak, _ = measure(lambda: load_binary_image_to_array(path), args.repeat)
+        record("load", seconds, peak, cells)
+
+    return results
+
+def compare_to_baseline(results, baseline, threshold):
+    """
+    Return a list of human-readable regressions: entries whose time grew by
+    more than `threshold` (0.25 = 25 %) relative to the baseline.
+    """
+    regressions = []
+    for name, entry in sorted(results.items()):
+        base = baseline.get(name)
+        if base is None or base["seconds"] <= 0:
+            continue
+        ratio = entry["seconds"] / base["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {entry['seconds'] * 1000:.2f} ms vs baseline {base['seconds'] * 1000:.2f} ms "
+                f"({(ratio - 1) * 100:.0f}% slower)"
+            )
+    return regressions
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark parsing, compiling, stepping and PNG I/O on synthetic boards.")
+    parser.add_argument("--sizes", default="128,512", help="comma-separated board side lengths")
+    parser.add_argument("--density", type=float, default=0.3, help="initial live-cell probability")
+    parser.add_argument("--portals", type=int, default=200, help="portal pairs per tunnel map")
+    parser.add_argument("--generations", type=int, default=20, help="generations timed per engine")
+    parser.add_argument("--engines", default="table,stencil,bitboard,frontier,memo,temporal", help="comma-separated engines")
+    parser.add_argument("--temporal-depths", default="1,8", help="generations per tile pass to compare for temporal tiling")
+    parser.add_argument("--strip-workers", default="", help='worker counts for strip decomposition, e.g. "4,8,16"')
+    parser.add_argument("--repeat", type=int, default=3, help="repeats per measurement (best time is kept)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.5, help="allowed slowdown before failing (0.5 = 50%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="write these results as the new baseline")
+    parser.add_argument("--output", default=None, help="also write the results JSON here")
+    args = parser.parse_args(argv)
+    args.sizes = [int(s) for s in args.sizes.split(",") if s]
+    args.engines = [e for e in args.engines.split(",") if e]
+    args.strip_workers = [int(w) for w in args.strip_workers.split(",") if w]
+    args.temporal_depths = [int(d) for d in args.temporal_depths.split(",") if d]
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"{'size':>8} {'phase':<22} {'best time':>13}  {'peak mem':>13}")
+    results = {}
+    for size in args.sizes:
+        results.update(run_size(size, args))
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "config": {k: getattr(args, k) for k in ("density", "portals", "generations", "repeat")},
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        print(f"\nSaved baseline to {args.baseline}")
+        return
+
+    if not os.path.isfile(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("config") != report["config"]:
+        print("\n⚠ Baseline was recorded with a different config; comparison may be meaningless.")
+    regressions = compare_to_baseline(results, baseline["results"], args.threshold)
+    if regressions:
+        print("\n✘ Performance regressions:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\n✔ No regressions beyond {args.threshold * 100:.0f}% of baseline.")
+
+if __name__ == "__main__":
+    main()
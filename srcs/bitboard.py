@@ -0,0 +1,214 @@
+# File: srcs/bitboard.py
+
+import numpy as np
+from game_of_life import RULE_TABLE
+
+WORD_BITS = 64
+_ONE = np.uint64(1)
+_TOP = np.uint64(WORD_BITS - 1)
+# Words per scratch plane; step() works through the board in row blocks of
+# about this size so the adder network's temporaries stay cache-sized.
+BLOCK_WORDS = 1 << 14
+
+def pack_grid(grid):
+    """
+    Pack a 2D boolean array into a (rows, ceil(cols/64)) uint64 array.
+    Bit j of word w in a row holds column w*64 + j; padding bits are 0.
+    """
+    rows, cols = grid.shape
+    nwords = -(-cols // WORD_BITS)
+    padded = np.zeros((rows, nwords * WORD_BITS), dtype=bool)
+    padded[:, :cols] = grid
+    return np.packbits(padded, axis=1, bitorder="little").view("<u8").astype(np.uint64, copy=False)
+
+def unpack_grid(words, cols):
+    """
+    Inverse of pack_grid: return the (rows, cols) boolean array held in `words`.
+    """
+    as_bytes = np.ascontiguousarray(words).astype("<u8", copy=False).view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, bitorder="little", count=cols).astype(bool)
+
+class BitboardLife:
+    """
+    Game of Life on a bit-packed board: 64 cells per uint64 word, advanced with
+    bitwise full-adder neighbor counting over whole rows of words at once.
+
+    Wormholes are applied as a sparse overlay: the cells listed in
+    `corrections` (see GameOfLifeWormhole.compile_wormhole_corrections) are
+    recomputed from their resolved neighbors after the word-parallel pass.
+
+    The board lives in two preallocated (rows+2, nwords) buffers whose first
+    and last rows stay zero, so vertical neighbors never need bounds checks.
+    Generations swap between the buffers; nothing is allocated per step.
+    The adder network runs over blocks of rows, so its twelve scratch planes
+    hold about BLOCK_WORDS words each whatever the board size: the footprint
+    is 2 bits per cell for the buffers plus ~1.5 MiB of scratch (and the
+    overlay's index arrays, 32 bytes per neighbor of a wormhole-affected cell).
+    """
+
+    def __init__(self, grid, corrections=None):
+        """
+        grid:        2D boolean numpy array (True = alive, False = dead)
+        corrections: optional (cells, table) pair of flat cell indices and their
+                     (n, 8) resolved neighbor indices, rows*cols = out-of-bounds
+        """
+        self.rows, self.cols = grid.shape
+        self.nwords = -(-self.cols // WORD_BITS)
+        shape = (self.rows + 2, self.nwords)
+
+        self._buffers = [np.zeros(shape, dtype=np.uint64), np.zeros(shape, dtype=np.uint64)]
+        self.load(grid)
+
+        # Bits of the last word that belong to real columns
+        tail = self.cols - (self.nwords - 1) * WORD_BITS
+        self._tail_mask = np.uint64((1 << tail) - 1) if tail < WORD_BITS else ~np.uint64(0)
+
+        # Scratch planes for the adder network, one row block at a time
+        self._block_rows = max(1, min(self.rows, BLOCK_WORDS // self.nwords))
+        self._west, self._east, self._tmp, self._h0, self._h1, self._m0, self._m1 = (
+            np.empty((self._block_rows + 2, self.nwords), dtype=np.uint64) for _ in range(7)
+        )
+        inner = (self._block_rows, self.nwords)
+        self._s0, self._c0, self._p, self._two, self._t = (
+            np.empty(inner, dtype=np.uint64) for _ in range(5)
+        )
+
+        self._overlay = None
+        if corrections is not None and len(corrections[0]):
+            self._overlay = self._compile_overlay(*corrections)
+
+    def _compile_overlay(self, cells, table):
+        """
+        Turn flat cell indices into (word index, bit) pairs on the padded buffer.
+        Out-of-bounds neighbors map to word 0, bit 0 of the all-zero top row.
+        """
+        sentinel = self.rows * self.cols
+
+        def locate(flat):
+            r, c = np.divmod(flat.astype(np.int64), self.cols)
+            word = (r + 1) * self.nwords + c // WORD_BITS
+            bit = (c % WORD_BITS).astype(np.uint64)
+            return word, bit
+
+        cell_word, cell_bit = locate(cells)
+        nb_word, nb_bit = locate(table)
+        outside = table == sentinel
+        nb_word[outside] = 0
+        nb_bit[outside] = 0
+        return cell_word, cell_bit, nb_word, nb_bit
+
+    def load(self, grid):
+        """Replace the current generation with the boolean array `grid` (same shape)."""
+        if grid.shape != (self.rows, self.cols):
+            raise ValueError(f"Grid shape {grid.shape} does not match board shape {(self.rows, self.cols)}")
+        self._current = 0
+        self._buffers[0][1:-1] = pack_grid(grid)
+
+    @property
+    def words(self):
+        """The current generation as a (rows, nwords) uint64 view."""
+        return self._buffers[self._current][1:-1]
+
+    @property
+    def grid(self):
+        """The current generation unpacked into a (rows, cols) boolean array."""
+        return unpack_grid(self.words, self.cols)
+
+    def step(self):
+        """
+        Execute one generation.
+        """
+        cur = self._buffers[self._current]
+        nxt = self._buffers[1 - self._current]
+        for r0 in range(0, self.rows, self._block_rows):
+            r1 = min(r0 + self._block_rows, self.rows)
+            # Real rows r0..r1 are padded rows r0+1..r1, read with one row of context each side
+            self._step_block(cur[r0:r1 + 2], nxt[r0 + 1:r1 + 1])
+
+        if self._overlay is not None:
+            self._apply_overlay(cur, nxt)
+
+        self._current = 1 - self._current
+
+    def _step_block(self, cur, out):
+        """
+        Write into `out` the next generation of the rows inside `cur`, which
+        carries one extra row above and below them.
+        """
+        h = out.shape[0]
+        W, E, tmp = self._west[:h + 2], self._east[:h + 2], self._tmp[:h + 2]
+        h0, h1, m0, m1 = self._h0[:h + 2], self._h1[:h + 2], self._m0[:h + 2], self._m1[:h + 2]
+        s0, c0, p, two, t = self._s0[:h], self._c0[:h], self._p[:h], self._two[:h], self._t[:h]
+
+        # West / east neighbor planes: bit c holds cell c-1 / c+1,
+        # carrying bits across word boundaries.
+        np.left_shift(cur, _ONE, out=W)
+        np.right_shift(cur[:, :-1], _TOP, out=tmp[:, 1:])
+        W[:, 1:] |= tmp[:, 1:]
+        np.right_shift(cur, _ONE, out=E)
+        np.left_shift(cur[:, 1:], _TOP, out=tmp[:, :-1])
+        E[:, :-1] |= tmp[:, :-1]
+
+        # Per-row sums: h = W + C + E (for rows above/below), m = W + E (own row)
+        np.bitwise_xor(W, cur, out=h0)
+        np.bitwise_and(E, h0, out=h1)
+        h0 ^= E
+        np.bitwise_and(W, cur, out=tmp)
+        h1 |= tmp
+        np.bitwise_xor(W, E, out=m0)
+        np.bitwise_and(W, E, out=m1)
+
+        u0, u1 = h0[:-2], h1[:-2]
+        d0, d1 = h0[2:], h1[2:]
+        w0, w1 = m0[1:-1], m1[1:-1]
+
+        # Bit 0 of the count, and its carry into bit 1
+        np.bitwise_xor(u0, w0, out=t)
+        np.bitwise_xor(t, d0, out=s0)
+        np.bitwise_and(t, d0, out=c0)
+        np.bitwise_and(u0, w0, out=t)
+        c0 |= t
+
+        # Bit 1 and above: count is 2 or 3 exactly when one of u1, w1, d1, c0 is set
+        np.bitwise_xor(u1, w1, out=p)
+        p ^= d1
+        p ^= c0
+        np.bitwise_and(u1, w1, out=two)
+        np.bitwise_and(d1, c0, out=t)
+        two |= t
+        np.bitwise_or(u1, w1, out=t)
+        np.bitwise_or(d1, c0, out=tmp[1:-1])
+        t &= tmp[1:-1]
+        two |= t
+
+        # Alive next: count in {2, 3} and (count odd or already alive)
+        np.bitwise_or(s0, cur[1:-1], out=out)
+        out &= p
+        np.invert(two, out=t)
+        out &= t
+        out[:, -1] &= self._tail_mask
+
+    def _apply_overlay(self, cur, nxt):
+        """
+        Recompute the wormhole-affected cells from their resolved neighbors and
+        overwrite their bits in `nxt`.
+        """
+        cell_word, cell_bit, nb_word, nb_bit = self._overlay
+        cur_flat = cur.ravel()
+        nxt_flat = nxt.ravel()
+
+        counts = ((cur_flat[nb_word] >> nb_bit) & _ONE).sum(axis=1)
+        alive = (cur_flat[cell_word] >> cell_bit) & _ONE
+        new = RULE_TABLE[alive.astype(np.intp), counts].astype(np.uint64)
+
+        masks = _ONE << cell_bit
+        np.bitwise_and.at(nxt_flat, cell_word, ~masks)
+        np.bitwise_or.at(nxt_flat, cell_word, masks * new)
+
+    def simulate(self, iterations):
+        """
+        Run `iterations` steps consecutively. Returns the final grid.
+        """
+        for _ in range(iterations):
+            self.step()
+        return self.grid
@@ -0,0 +1,109 @@
+# File: srcs/checkpoint_writer.py
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from image_utils import save_grid
+from metrics import timed
+
+DEFAULT_CHECKPOINTS = [1, 10, 100, 1000]
+
+def parse_checkpoints(spec):
+    """
+    Turn a checkpoint spec into a sorted list of unique positive generations.
+    `spec` is either an iterable of ints, or a comma-separated string whose
+    parts are plain generations or "every:N:LAST" (N, 2N, … up to LAST), e.g.
+      "1,10,100,1000"   → [1, 10, 100, 1000]
+      "every:50:200"    → [50, 100, 150, 200]
+      "1,every:250:1000" → [1, 250, 500, 750, 1000]
+    """
+    if isinstance(spec, str):
+        generations = []
+        for part in spec.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if part.startswith("every:"):
+                try:
+                    _, step, last = part.split(":")
+                    step, last = int(step), int(last)
+                except ValueError:
+                    raise ValueError(f"Bad checkpoint spec '{part}': expected every:N:LAST") from None
+                if step <= 0:
+                    raise ValueError(f"Bad checkpoint spec '{part}': N must be positive")
+                generations.extend(range(step, last + 1, step))
+            else:
+                generations.append(int(part))
+    else:
+        generations = [int(g) for g in spec]
+
+    if any(g <= 0 for g in generations):
+        raise ValueError(f"Checkpoints must be positive generations, got {sorted(generations)}")
+    if not generations:
+        raise ValueError("Checkpoint spec is empty")
+    return sorted(set(generations))
+
+class CheckpointWriter:
+    """
+    Encodes checkpoint PNGs on background threads so the simulation keeps
+    stepping while zlib runs (Pillow releases the GIL while encoding).
+    Paths ending in .raw are written in the raw grid format instead.
+
+    submit() snapshots the grid before returning, so the caller may keep
+    mutating it. At most `max_pending` snapshots are queued or in flight;
+    beyond that submit() blocks, bounding memory. close() waits for all
+    writes, re-raises the first failure and returns the paths in submission
+    order, so callers can report them from their own thread. A closed writer
+    accepts no more submits. Encoding time is added to the "encode" phase of
+    `metrics` when given.
+    """
+
+    def __init__(self, max_pending=8, workers=2, metrics=None):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="checkpoint-writer")
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._futures = []
+        self._metrics = metrics
+        self._closed = False
+
+    def submit(self, grid, path):
+        """Queue `grid` to be written to `path`."""
+        if self._closed:
+            raise RuntimeError("CheckpointWriter is closed")
+        snapshot = grid.copy()
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(self._write, snapshot, path)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._futures.append(future)
+
+    def _write(self, snapshot, path):
+        try:
+            with timed(self._metrics, "encode"):
+                save_grid(snapshot, path)
+            return path
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """
+        Wait for every queued write and shut the writer down; raise the first
+        error, if any. Returns the paths written, in submission order (empty
+        on a repeated close()).
+        """
+        self._closed = True
+        self._pool.shutdown(wait=True)
+        futures, self._futures = self._futures, []
+        return [future.result() for future in futures]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Don't mask the original error with a write failure
+            self._closed = True
+            self._pool.shutdown(wait=True)
+        return False
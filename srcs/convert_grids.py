@@ -0,0 +1,55 @@
+# File: srcs/convert_grids.py
+
+import argparse
+import os
+import re
+from image_utils import RAW_ENCODINGS, png_to_raw, raw_to_png
+
+# Binary grids in the data/ and output/ layouts; tunnel maps are colour images and are left alone
+_GRID_NAME = re.compile(r"^(starting_position|\d+)\.(png|raw)$")
+
+def find_grids(paths, extension):
+    """
+    Yield every grid file with `extension` ("png" or "raw") among `paths`,
+    which may be files or directories (searched recursively). Inside
+    directories only starting_position.* and checkpoint <N>.* files count.
+    """
+    for path in paths:
+        if os.path.isfile(path):
+            if path.endswith("." + extension):
+                yield path
+            continue
+        for root, _, files in os.walk(path):
+            for name in sorted(files):
+                match = _GRID_NAME.match(name)
+                if match and match.group(2) == extension:
+                    yield os.path.join(root, name)
+
+def convert(paths, to, encoding="uint8"):
+    """Convert grids under `paths` to format `to` next to the originals; returns the new paths."""
+    source = "png" if to == "raw" else "raw"
+    written = []
+    for src in find_grids(paths, source):
+        dst = src[: -len(source)] + to
+        if to == "raw":
+            png_to_raw(src, dst, encoding)
+        else:
+            raw_to_png(src, dst)
+        print(f"{src} → {dst}")
+        written.append(dst)
+    return written
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert board grids between PNG and the raw memory-mappable format.")
+    parser.add_argument("to", choices=["raw", "png"], help="target format")
+    parser.add_argument("paths", nargs="+", help="grid files or directories such as data/ or output/")
+    parser.add_argument(
+        "--encoding", choices=sorted(RAW_ENCODINGS), default="uint8",
+        help="raw cell encoding: uint8 (memory-mapped as-is) or bits (8x smaller)",
+    )
+    args = parser.parse_args(argv)
+    written = convert(args.paths, args.to, args.encoding)
+    print(f"Converted {len(written)} grid(s).")
+
+if __name__ == "__main__":
+    main()
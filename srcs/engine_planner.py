@@ -0,0 +1,148 @@
+# File: srcs/engine_planner.py
+
+import numpy as np
+
+# Per-generation cost model, in nanoseconds, fitted on one core to the
+# data/problem-* cases and to synthetic 128-1024 boards with 0-175k
+# wormhole-corrected cells (srcs/synthetic.py, as in benchmarks/run_benchmarks.py):
+#   stencil   fixed + per cell + per corrected cell (their gather)
+#   bitboard  far cheaper per cell, but each corrected cell costs a scattered
+#             bit gather, so it falls behind stencil past ~11% corrected cells
+#             (data/problem-3 is 71%: 4.5 ms/gen against 2.2)
+#   sparse    per live cell and per corrected cell, which it re-counts every
+#             generation; only worth it when both are rare
+#   frontier  per cell changed in the last generation; on a quiet board it
+#             wins by orders of magnitude (problem-3 settles to ~30 changes
+#             per generation: 0.08 ms/gen), on an active one it is the slowest
+# When a run steps one generation at a time (detect_cycles or history),
+# bitboard and sparse also convert from and to the dense grid every step.
+# table is never cheaper than stencil; temporal measured at best level with
+# bitboard and 3x behind it with many corrected cells; memo only pays off on
+# boards that repeat tile contents, which this model cannot see. None of
+# them is picked.
+COSTS = {
+    "stencil": {"fixed": 20_000, "cell": 6.0, "corrected": 35.0},
+    "bitboard": {"fixed": 40_000, "cell": 0.3, "corrected": 85.0, "per_step_cell": 0.2},
+    "sparse": {"fixed": 135_000, "live": 400.0, "corrected": 400.0, "per_step_cell": 0.13},
+    "frontier": {"fixed": 30_000, "changed": 1300.0},
+}
+# Switching to frontier evaluates the whole board once and builds the
+# neighbor and reverse-neighbor tables (~72 B/cell, so capped by board
+# size); the planner spreads that over one check interval
+FRONTIER_SWITCH_NS_PER_CELL = 650.0
+FRONTIER_MAX_CELLS = 1 << 22
+
+def estimate_costs(shape, live_cells, corrected_cells, changed_cells=None, per_step=False):
+    """
+    Estimated nanoseconds per generation of each candidate engine for a
+    board of `shape` with `live_cells` alive, `corrected_cells` whose
+    neighbors go through a wormhole (len(compile_wormhole_corrections()[0]))
+    and `changed_cells` flipping per generation (unknown: assume every live
+    cell). per_step: the run is advanced one step() at a time.
+    """
+    rows, cols = shape
+    cells = rows * cols
+    changed = live_cells if changed_cells is None else changed_cells
+    costs = {}
+    for engine, c in COSTS.items():
+        if engine == "frontier" and cells > FRONTIER_MAX_CELLS:
+            continue
+        ns = (
+            c["fixed"]
+            + c.get("cell", 0.0) * cells
+            + c.get("corrected", 0.0) * corrected_cells
+            + c.get("live", 0.0) * live_cells
+            + c.get("changed", 0.0) * changed
+        )
+        if per_step:
+            ns += c.get("per_step_cell", 0.0) * cells
+        costs[engine] = ns
+    return costs
+
+def choose_engine(shape, live_cells, corrected_cells, changed_cells=None, per_step=False):
+    """
+    Pick the engine with the lowest estimate_costs() estimate. Returns
+    (engine, reason), reason being a short human-readable justification.
+    """
+    costs = estimate_costs(shape, live_cells, corrected_cells, changed_cells, per_step)
+    engine = min(costs, key=costs.get)
+    return engine, _reason(shape, costs, engine, live_cells, corrected_cells, changed_cells, per_step)
+
+def _reason(shape, costs, engine, live_cells, corrected_cells, changed_cells, per_step):
+    rows, cols = shape
+    changed = "unknown" if changed_cells is None else str(changed_cells)
+    mode = ", per-step" if per_step else ""
+    others = ", ".join(f"{e} {ns / 1e3:.0f}" for e, ns in sorted(costs.items(), key=lambda kv: kv[1]) if e != engine)
+    return (
+        f"~{costs[engine] / 1e3:.0f} us/gen vs {others}; {rows}x{cols}, {live_cells} live, "
+        f"{corrected_cells} wormhole-corrected, {changed} changing{mode}"
+    )
+
+class EnginePlanner:
+    """
+    Chooses a GameOfLifeWormhole's engine from estimate_costs() and re-plans
+    every `check_every` generations from the live count and the number of
+    cells that changed in the last generation (see observe()), e.g. as a
+    dense soup dies down to a few gliders or a wormhole-heavy board goes
+    quiet. It only switches when the best engine is estimated to be at least
+    `switch_margin` cheaper than the current one, so close calls do not
+    flap. Every decision is appended to `decisions` as (generation, engine,
+    reason) and, when verbose, printed.
+    """
+
+    def __init__(self, check_every=32, switch_margin=0.25, verbose=True):
+        if check_every <= 0:
+            raise ValueError("check_every must be positive")
+        if not 0 <= switch_margin < 1:
+            raise ValueError("switch_margin must be in [0, 1)")
+        self.check_every = check_every
+        self.switch_margin = switch_margin
+        self.verbose = verbose
+        self.decisions = []
+        self.changed_cells = None
+        self._checked_at = None
+        self._per_step = None
+
+    def observe(self, before, after):
+        """Record how many cells changed between two consecutive generations."""
+        self.changed_cells = int(np.count_nonzero(before != after))
+
+    def _log(self, gol, verb, engine, reason):
+        self.decisions.append((gol.generation, engine, reason))
+        if self.verbose:
+            print(f"[engine planner] generation {gol.generation}: {verb} {engine} ({reason})")
+
+    def plan(self, gol, per_step=False):
+        """Choose an engine for `gol`'s current grid and switch to it."""
+        shape = (gol.rows, gol.cols)
+        live = int(np.count_nonzero(gol.grid))
+        corrected = len(gol.compile_wormhole_corrections()[0])
+        costs = estimate_costs(shape, live, corrected, self.changed_cells, per_step)
+        if gol.engine != "frontier" and "frontier" in costs:
+            costs["frontier"] += FRONTIER_SWITCH_NS_PER_CELL * gol.rows * gol.cols / self.check_every
+        self._checked_at = gol.generation
+        self._per_step = per_step
+
+        best = min(costs, key=costs.get)
+        first = not self.decisions
+        if not first and gol.engine in costs and costs[best] > (1 - self.switch_margin) * costs[gol.engine]:
+            return gol.engine
+        if first or best != gol.engine:
+            reason = _reason(shape, costs, best, live, corrected, self.changed_cells, per_step)
+            self._log(gol, "using" if first else "switching to", best, reason)
+            gol.engine = best
+        return best
+
+    def update(self, gol, per_step=False):
+        """
+        Re-plan if `check_every` generations have passed since the last
+        check, or the run switched between whole-chunk and per-step
+        stepping. Returns the engine now in use.
+        """
+        if (
+            self._checked_at is not None
+            and abs(gol.generation - self._checked_at) < self.check_every
+            and per_step == self._per_step
+        ):
+            return gol.engine
+        return self.plan(gol, per_step)
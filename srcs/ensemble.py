@@ -0,0 +1,137 @@
+# File: srcs/ensemble.py
+
+import numpy as np
+from game_of_life import RULE_TABLE, GameOfLifeWormhole
+from checkpoint_writer import parse_checkpoints
+
+# Per-member status values
+RUNNING = "running"
+DIED = "died"            # no live cells left
+STILL = "still"          # next generation equals the current one (period 1)
+OSCILLATING = "period-2"  # returns to the state from two generations ago
+
+class EnsembleGameOfLife:
+    """
+    Many starting grids advanced together over one shared wormhole topology.
+
+    The members live in a (batch, rows, cols) stack and every generation is
+    one gather over the shared neighbor table for all still-running members.
+    A member stops being stepped once it dies out, becomes a still life, or
+    settles into a period-2 oscillator; its later generations are then
+    looked up from its last one or two states.
+    """
+
+    def __init__(self, grids, h_wormholes=None, v_wormholes=None, neighbor_table=None):
+        """
+        grids:          (batch, rows, cols) boolean array of starting positions
+        h_wormholes:    dict mapping (r, c) → (r2, c2) for horizontal tunnels
+        v_wormholes:    dict mapping (r, c) → (r2, c2) for vertical tunnels
+        neighbor_table: optional precompiled table for this shape and topology
+                        (see GameOfLifeWormhole.compile_neighbor_table)
+        """
+        grids = np.asarray(grids, dtype=bool)
+        if grids.ndim != 3:
+            raise ValueError(f"grids must have shape (batch, rows, cols), got {grids.shape}")
+        self.batch, self.rows, self.cols = grids.shape
+        n = self.rows * self.cols
+
+        if neighbor_table is None:
+            topology = GameOfLifeWormhole(np.zeros((self.rows, self.cols), dtype=bool), h_wormholes, v_wormholes)
+            neighbor_table = topology.compile_neighbor_table()
+        # One contiguous row per direction keeps each gather cache-friendly
+        self._columns = np.ascontiguousarray(neighbor_table.T)
+
+        # Flat boards with a trailing always-dead sentinel cell
+        self._flat = np.zeros((self.batch, n + 1), dtype=np.uint8)
+        self._flat[:, :n] = grids.reshape(self.batch, n)
+        self._prev = None
+
+        self.generation = 0
+        self.status = np.array([RUNNING] * self.batch, dtype=object)
+        self.stopped_at = np.full(self.batch, -1, dtype=np.int64)
+        self._cycle_states = {}
+        for member in np.flatnonzero(~self._flat.any(axis=1)):
+            self._stop(member, DIED, [self._flat[member, :n].copy()])
+
+    @property
+    def active(self):
+        """Indices of the members that are still being stepped."""
+        return np.flatnonzero(self.status == RUNNING)
+
+    @property
+    def grids(self):
+        """All members at the current generation as a (batch, rows, cols) array."""
+        return self.state_at(self.generation)
+
+    def _stop(self, member, status, states):
+        self.status[member] = status
+        self.stopped_at[member] = self.generation
+        self._cycle_states[member] = states
+
+    def step(self):
+        """
+        Execute one generation for every running member.
+        """
+        n = self.rows * self.cols
+        active = self.active
+        self.generation += 1
+        if active.size == 0:
+            return
+
+        flat = self._flat[active]
+        counts = np.zeros((active.size, n), dtype=np.uint8)
+        for column in self._columns:
+            counts += flat[:, column]
+        new = RULE_TABLE[flat[:, :n], counts]
+
+        prev = self._prev[active] if self._prev is not None else None
+        if self._prev is None:
+            self._prev = np.zeros((self.batch, n), dtype=bool)
+        self._prev[active] = flat[:, :n]
+        self._flat[active, :n] = new
+
+        # Early termination checks, per member
+        alive = new.any(axis=1)
+        still = (new == flat[:, :n]).all(axis=1)
+        period2 = (new == prev).all(axis=1) if prev is not None else np.zeros(active.size, dtype=bool)
+        for i, member in enumerate(active.tolist()):
+            if not alive[i]:
+                self._stop(member, DIED, [new[i].copy()])
+            elif still[i]:
+                self._stop(member, STILL, [new[i].copy()])
+            elif period2[i]:
+                self._stop(member, OSCILLATING, [new[i].copy(), flat[i, :n].astype(bool)])
+
+    def state_at(self, generation):
+        """
+        Return every member at `generation` as a (batch, rows, cols) array.
+        Running members must be exactly at `generation`; stopped members can
+        be queried at any generation from the one they stopped at onward.
+        """
+        n = self.rows * self.cols
+        out = self._flat[:, :n].astype(bool)
+        for member, states in self._cycle_states.items():
+            if generation < self.stopped_at[member]:
+                raise ValueError(f"Member {member} stopped at {self.stopped_at[member]}, before {generation}")
+            out[member] = states[(generation - self.stopped_at[member]) % len(states)]
+        if generation != self.generation and self.active.size:
+            raise ValueError(f"Running members are at generation {self.generation}, not {generation}")
+        return out.reshape(self.batch, self.rows, self.cols)
+
+    def simulate(self, checkpoints):
+        """
+        Advance to every generation in `checkpoints` (any spec accepted by
+        parse_checkpoints) and return {generation: (batch, rows, cols) array}.
+        Once every member has stopped, the remaining checkpoints are looked up
+        without stepping.
+        """
+        results = {}
+        for target in parse_checkpoints(checkpoints):
+            if target < self.generation:
+                raise ValueError(f"Checkpoint {target} is before the current generation {self.generation}")
+            while self.generation < target and self.active.size:
+                self.step()
+            if not self.active.size:
+                self.generation = max(self.generation, target)
+            results[target] = self.state_at(target)
+        return results
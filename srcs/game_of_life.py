@@ -1,6 +1,55 @@
 # File: srcs/game_of_life.py
 
+import hashlib
 import numpy as np
+from metrics import timed
+
+# Neighbor directions, in the order used by get_neighbor_positions and by the
+# columns of the compiled neighbor table.
+DIRECTIONS = [
+    (-1,  0),  # top
+    (-1,  1),  # top-right
+    ( 0,  1),  # right
+    ( 1,  1),  # bottom-right
+    ( 1,  0),  # bottom
+    ( 1, -1),  # bottom-left
+    ( 0, -1),  # left
+    (-1, -1),  # top-left
+]
+
+# RULE_TABLE[alive, live_neighbors] → next state (B3/S23)
+RULE_TABLE = np.zeros((2, 9), dtype=bool)
+RULE_TABLE[0, 3] = True
+RULE_TABLE[1, 2] = True
+RULE_TABLE[1, 3] = True
+
+ENGINES = ("table", "stencil", "bitboard", "frontier", "memo", "temporal", "sparse", "reference")
+
+def moore_counts(padded, out=None):
+    """
+    Plain Moore-neighborhood counts via shifted-array sums.
+    `padded` is a uint8 array of shape (R+2, C+2) whose border ring holds the
+    cells just outside the region (zeros at the board edge). Returns an (R, C)
+    uint8 array of live-neighbor counts, written into `out` if given.
+    """
+    R, C = padded.shape[0] - 2, padded.shape[1] - 2
+    if out is None:
+        out = np.empty((R, C), dtype=np.uint8)
+    np.add(padded[:-2, :-2], padded[:-2, 1:-1], out=out)
+    out += padded[:-2, 2:]
+    out += padded[1:-1, :-2]
+    out += padded[1:-1, 2:]
+    out += padded[2:, :-2]
+    out += padded[2:, 1:-1]
+    out += padded[2:, 2:]
+    return out
+
+def index_dtype(cells):
+    """
+    Dtype for flat cell indices (and the rows*cols sentinel) on a board of
+    `cells` cells: int32 to halve table memory, int64 once that would overflow.
+    """
+    return np.int32 if cells <= np.iinfo(np.int32).max else np.int64
 
 class GameOfLifeWormhole:
     """
@@ -9,16 +58,83 @@ class GameOfLifeWormhole:
     multiple wormholes could apply to a given directional step.
     """
 
-    def __init__(self, grid, h_wormholes=None, v_wormholes=None):
+    def __init__(self, grid, h_wormholes=None, v_wormholes=None, engine="table", tile_cache=None,
+                 neighbor_table=None, corrections=None, metrics=None):
         """
         grid:       2D boolean numpy array (True = alive, False = dead)
         h_wormholes: dict mapping (r, c) → (r2, c2) for horizontal tunnels
         v_wormholes: dict mapping (r, c) → (r2, c2) for vertical tunnels
+        engine:     how a generation is computed, one of ENGINES:
+                      "table"     – compiled neighbor table + NumPy gather (default)
+                      "stencil"   – shifted-array Moore sum, patched only at
+                                    cells whose neighbors go through a wormhole
+                      "bitboard"  – 64 cells per uint64 word, see bitboard.py
+                      "frontier"  – only re-evaluates cells next to last
+                                    generation's changes (incremental)
+                      "memo"      – per-tile LRU memoization, see tile_cache.py
+                      "temporal"  – several generations per cache-sized tile
+                                    pass, see temporal_tiling.py
+                      "sparse"    – sorted live-cell indices, work scales with
+                                    the population, see sparse_life.py
+                      "reference" – per-cell Python loop over get_neighbor_positions
+                    or "auto" to let an EnginePlanner pick from the board size,
+                    density and portal count, re-planning as the density
+                    changes (see engine_planner.py)
+        tile_cache: TileCache used by the "memo" engine (a default one is created
+                    if omitted); pass a shared instance to reuse it across boards
+        neighbor_table: optional precompiled compile_neighbor_table() result for
+                    this shape and these wormholes (e.g. from topology_cache.py)
+        corrections: likewise, a precompiled compile_wormhole_corrections()
+                    (cells, table) pair; the stencil, bitboard, temporal and
+                    sparse engines (and the "auto" planner) use it instead
+                    of the neighbor table
+        metrics:    optional RunMetrics; simulate() then records its wall time as
+                    the "step" phase and the "generations" / "steps_computed"
+                    counters. Nothing is recorded per step, so None costs nothing.
         """
+        if engine != "auto" and engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Expected 'auto' or one of: {', '.join(ENGINES)}")
         self.grid = grid.copy()
         self.rows, self.cols = grid.shape
         self.holes_h = h_wormholes or {}
         self.holes_v = v_wormholes or {}
+        self.engine = engine
+        self.metrics = metrics
+        if neighbor_table is not None and neighbor_table.shape != (self.rows * self.cols, len(DIRECTIONS)):
+            raise ValueError(
+                f"neighbor_table has shape {neighbor_table.shape}, expected {(self.rows * self.cols, len(DIRECTIONS))}"
+            )
+        self._neighbor_table = neighbor_table
+        if corrections is not None and (
+            len(corrections) != 2 or corrections[1].shape != (len(corrections[0]), len(DIRECTIONS))
+        ):
+            raise ValueError("corrections must be a (cells, table) pair with a (len(cells), 8) table")
+        self._corrections = corrections
+        self._padded = None
+        self._padded_corrections = None
+        self._reverse_neighbors = None
+        self.tile_cache = tile_cache
+        self._memo = None
+        self._flat = None
+        self._frontier = None
+        self._frontier_grid = None
+        self._tiler = None
+        self._bitboard = None
+        self._bitboard_grid = None
+
+        # Generations stepped since construction, plus cycle-detection state
+        self.generation = 0
+        self._seen_states = {}
+        self._cycle = None
+        self._cycle_grid = None  # grid the cycle history last ended on
+        self._steps_computed = 0
+
+        self.planner = None
+        if engine == "auto":
+            from engine_planner import EnginePlanner
+
+            self.planner = EnginePlanner()
+            self.planner.plan(self)
 
     def in_bounds(self, r, c):
         """Return True if (r, c) is within the grid."""
@@ -124,26 +240,272 @@ class GameOfLifeWormhole:
         Only in-bounds positions are returned.
         """
         positions = []
-        directions = [
-            (-1,  0),  # top
-            (-1,  1),  # top-right
-            ( 0,  1),  # right
-            ( 1,  1),  # bottom-right
-            ( 1,  0),  # bottom
-            ( 1, -1),  # bottom-left
-            ( 0, -1),  # left
-            (-1, -1),  # top-left
-        ]
-        for dr, dc in directions:
+        for dr, dc in DIRECTIONS:
             nr, nc = self.teleport(r, c, dr, dc)
             if self.in_bounds(nr, nc):
                 positions.append((nr, nc))
         return positions
 
+    def wormhole_candidates(self):
+        """
+        Return the in-bounds cells whose neighbors *may* differ from the plain
+        Moore neighborhood: every portal pixel plus the 8 cells around it.
+        teleport() only consults the source cell and the raw neighbor, so any
+        cell outside this set resolves every direction to its raw offset.
+        """
+        cells = set()
+        for (pr, pc) in list(self.holes_h) + list(self.holes_v):
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    r, c = pr + dr, pc + dc
+                    if self.in_bounds(r, c):
+                        cells.add((r, c))
+        return sorted(cells)
+
+    def compile_wormhole_corrections(self):
+        """
+        Return (cells, table) for the cells whose teleport-resolved neighbors
+        differ from the plain Moore stencil:
+          cells: int64 array of flat indices r*cols + c, ascending
+          table: (len(cells), 8) int32 (int64 on boards of 2**31+ cells) array of their neighbors in DIRECTIONS
+                 order, with rows*cols as the out-of-bounds sentinel
+        Every other cell can be counted with moore_counts(). Cached on the instance.
+        """
+        if self._corrections is not None:
+            return self._corrections
+
+        sentinel = self.rows * self.cols
+        cells, rows = [], []
+        for (r, c) in self.wormhole_candidates():
+            resolved, raw = [], []
+            for dr, dc in DIRECTIONS:
+                nr, nc = self.teleport(r, c, dr, dc)
+                resolved.append(nr * self.cols + nc if self.in_bounds(nr, nc) else sentinel)
+                rr, rc = r + dr, c + dc
+                raw.append(rr * self.cols + rc if self.in_bounds(rr, rc) else sentinel)
+            if resolved != raw:
+                cells.append(r * self.cols + c)
+                rows.append(resolved)
+
+        self._corrections = (
+            np.array(cells, dtype=np.int64),
+            np.array(rows, dtype=index_dtype(sentinel)).reshape(len(rows), len(DIRECTIONS)),
+        )
+        return self._corrections
+
+    def compile_neighbor_table(self):
+        """
+        Resolve every teleport once and return a (rows*cols, 8) int32 table
+        (int64 on boards of 2**31+ cells, like compile_wormhole_corrections).
+        Row r*cols + c lists the flat index of each neighbor of (r, c), in
+        DIRECTIONS order; out-of-bounds neighbors point at the sentinel index
+        rows*cols, which the step engine keeps permanently dead.
+        The table is built once and cached on the instance.
+        """
+        if self._neighbor_table is not None:
+            return self._neighbor_table
+
+        n = self.rows * self.cols
+        sentinel = n
+        rr, cc = np.divmod(np.arange(n, dtype=np.int64), self.cols)
+        table = np.empty((n, len(DIRECTIONS)), dtype=index_dtype(n))
+
+        # 1) Plain Moore stencil for every cell
+        for k, (dr, dc) in enumerate(DIRECTIONS):
+            nr, nc = rr + dr, cc + dc
+            ok = (nr >= 0) & (nr < self.rows) & (nc >= 0) & (nc < self.cols)
+            table[:, k] = np.where(ok, nr * self.cols + nc, sentinel)
+
+        # 2) Overwrite the cells whose neighbors go through a wormhole
+        cells, corr_table = self.compile_wormhole_corrections()
+        table[cells] = corr_table
+
+        self._neighbor_table = table
+        return table
+
+    def compile_reverse_neighbors(self):
+        """
+        Invert the neighbor table: return CSR arrays (indptr, indices) such that
+        indices[indptr[j]:indptr[j+1]] are the cells that count j as a neighbor,
+        i.e. the cells whose next state can change when j changes. Wormholes make
+        this relation asymmetric, so it is not just the Moore neighborhood of j.
+        """
+        if self._reverse_neighbors is not None:
+            return self._reverse_neighbors
+
+        n = self.rows * self.cols
+        table = self.compile_neighbor_table()
+        targets = table.ravel()
+        sources = np.repeat(np.arange(n, dtype=np.int64), table.shape[1])
+        keep = targets != n
+        targets, sources = targets[keep], sources[keep]
+
+        order = np.argsort(targets, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(targets, minlength=n), out=indptr[1:])
+        self._reverse_neighbors = (indptr, sources[order])
+        return self._reverse_neighbors
+
     def step(self):
         """
         Execute one generation of Game of Life with wormholes.
         """
+        if self.engine == "reference":
+            self._step_reference()
+        elif self.engine == "bitboard":
+            self._run_bitboard(1)
+        elif self.engine == "stencil":
+            self._step_stencil()
+        elif self.engine == "frontier":
+            self._step_frontier()
+        elif self.engine == "memo":
+            self._step_memo()
+        elif self.engine == "temporal":
+            self._run_temporal(1)
+        elif self.engine == "sparse":
+            self._run_sparse(1)
+        else:
+            self._step_table()
+        self.generation += 1
+        self._steps_computed += 1
+
+    def _step_table(self):
+        """
+        One generation via the compiled neighbor table: gather the 8 neighbor
+        states of every cell at once, sum them, and apply RULE_TABLE.
+        """
+        table = self.compile_neighbor_table()
+        flat = np.zeros(self.rows * self.cols + 1, dtype=np.uint8)
+        flat[:-1] = self.grid.ravel()
+        counts = flat[table].sum(axis=1, dtype=np.uint8)
+        self.grid = RULE_TABLE[flat[:-1], counts].reshape(self.rows, self.cols)
+
+    def _step_frontier(self):
+        """
+        One generation that only re-evaluates the cells changed in the last
+        generation plus every cell that has one of them as a (teleport-resolved)
+        neighbor. The grid is a view into a persistent flat buffer and is
+        updated in place, so per-generation cost scales with activity rather
+        than rows*cols. If `grid` was reassigned since the last step, the whole
+        board is evaluated once to rebuild the frontier.
+        """
+        n = self.rows * self.cols
+        table = self.compile_neighbor_table()
+
+        if self._frontier is None or self._frontier_grid is not self.grid:
+            self._flat = np.zeros(n + 1, dtype=bool)
+            self._flat[:-1] = self.grid.ravel()
+            self.grid = self._frontier_grid = self._flat[:-1].reshape(self.rows, self.cols)
+            candidates = np.arange(n, dtype=np.int64)
+        else:
+            changed = self._frontier
+            indptr, indices = self.compile_reverse_neighbors()
+            starts = indptr[changed]
+            lengths = indptr[changed + 1] - starts
+            offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+            dependents = indices[offsets + np.arange(lengths.sum())]
+            candidates = np.unique(np.concatenate((changed, dependents)))
+
+        flat = self._flat
+        old = flat[candidates]
+        counts = flat[table[candidates]].sum(axis=1, dtype=np.uint8)
+        new = RULE_TABLE[old.view(np.uint8), counts]
+
+        self._frontier = candidates[new != old]
+        flat[self._frontier] = new[new != old]
+
+    def _step_memo(self):
+        """
+        One generation through TileMemoStepper: wormhole-free tiles are looked
+        up in (or added to) self.tile_cache, the rest are computed directly.
+        """
+        if self._memo is None:
+            from tile_cache import TileCache, TileMemoStepper
+
+            if self.tile_cache is None:
+                self.tile_cache = TileCache()
+            self._memo = TileMemoStepper(self.rows, self.cols, self.compile_wormhole_corrections(), self.tile_cache)
+        self.grid = self._memo.step(self.grid)
+
+    def _step_stencil(self):
+        """
+        One generation via moore_counts() over the whole board, then overwrite
+        the counts of the (few) wormhole-affected cells with a gather through
+        their resolved neighbors. Cost is O(rows*cols) NumPy work plus
+        O(wormhole cells) for the correction.
+        """
+        if self._padded is None:
+            self._padded = np.zeros((self.rows + 2, self.cols + 2), dtype=np.uint8)
+            self._padded_corrections = self._to_padded_index(*self.compile_wormhole_corrections())
+        cells, corr_table = self._padded_corrections
+        padded = self._padded
+        padded[1:-1, 1:-1] = self.grid
+        counts = moore_counts(padded)
+
+        if len(cells):
+            counts.ravel()[cells] = padded.ravel()[corr_table].sum(axis=1, dtype=np.uint8)
+
+        self.grid = RULE_TABLE[padded[1:-1, 1:-1], counts]
+
+    def _to_padded_index(self, cells, corr_table):
+        """
+        Translate a correction list into indices on the zero-bordered
+        (rows+2, cols+2) buffer, so the gather reads the padded board directly.
+        The sentinel maps to the top-left border cell, which is always 0.
+        Target cells keep their plain flat index since they index `counts`.
+        """
+        sentinel = self.rows * self.cols
+        r, c = np.divmod(corr_table.astype(np.int64), self.cols)
+        padded_index = (r + 1) * (self.cols + 2) + (c + 1)
+        padded_index[corr_table == sentinel] = 0
+        return cells, padded_index
+
+    def _run_bitboard(self, iterations):
+        """
+        Advance `iterations` generations on a BitboardLife kept on the
+        instance and unpack the result. The board is only re-packed if `grid`
+        was reassigned since it was last unpacked, so single step() calls
+        reuse its buffers too.
+        """
+        if self._bitboard is None:
+            from bitboard import BitboardLife
+
+            self._bitboard = BitboardLife(self.grid, self.compile_wormhole_corrections())
+        elif self._bitboard_grid is not self.grid:
+            self._bitboard.load(self.grid)
+        self.grid = self._bitboard_grid = self._bitboard.simulate(iterations)
+
+    def _run_temporal(self, iterations):
+        """
+        Advance `iterations` generations with TemporalTiler, which steps
+        wormhole-free tiles several generations at a time.
+        """
+        if self._tiler is None:
+            from temporal_tiling import TemporalTiler
+
+            self._tiler = TemporalTiler(self.rows, self.cols, self.compile_wormhole_corrections())
+        self.grid = self._tiler.advance(self.grid, iterations)
+
+    def _run_sparse(self, iterations):
+        """
+        Convert the grid to live-cell indices once, advance `iterations`
+        generations with sparse_life.step_live, and densify the result.
+        """
+        from sparse_life import step_live
+
+        live = np.flatnonzero(self.grid)
+        corrections = self.compile_wormhole_corrections()
+        for _ in range(iterations):
+            live = step_live(live, self.rows, self.cols, corrections)
+        grid = np.zeros(self.rows * self.cols, dtype=bool)
+        grid[live] = True
+        self.grid = grid.reshape(self.rows, self.cols)
+
+    def _step_reference(self):
+        """
+        One generation via the original per-cell loop over get_neighbor_positions.
+        Kept as the ground truth the faster engines are checked against.
+        """
         new_grid = np.zeros_like(self.grid)
         for r in range(self.rows):
             for c in range(self.cols):
@@ -161,10 +523,200 @@ class GameOfLifeWormhole:
 
         self.grid = new_grid
 
-    def simulate(self, iterations):
+    def state_digest(self):
         """
-        Run `iterations` steps consecutively. Returns the final grid.
+        Return a 16-byte digest of the current grid (shape + packed cells).
         """
-        for _ in range(iterations):
-            self.step()
+        h = hashlib.blake2b(digest_size=16)
+        h.update(np.asarray(self.grid.shape, dtype=np.int64).tobytes())
+        h.update(np.packbits(self.grid).tobytes())
+        return h.digest()
+
+    @property
+    def cycle_stats(self):
+        """
+        Cycle-detection report for simulate(..., detect_cycles=True):
+          detected:        True once a repeated generation has been seen
+          start, period:   first generation of the cycle and its length (or None)
+          generation:      current generation number
+          steps_computed:  generations actually stepped (the rest were skipped)
+        """
+        start, period = (self._cycle[0], self._cycle[1]) if self._cycle else (None, None)
+        return {
+            "detected": self._cycle is not None,
+            "start": start,
+            "period": period,
+            "generation": self.generation,
+            "steps_computed": self._steps_computed,
+        }
+
+    def _record_state(self):
+        """
+        Hash the current generation. If the same grid was seen at generation
+        g0, the board is periodic from g0 with period p = generation - g0.
+        The states of the cycle are collected (packed) by _jump_to() as runs
+        pass through them, starting with this one.
+        """
+        digest = self.state_digest()
+        first_seen = self._seen_states.get(digest)
+        if first_seen is None:
+            self._seen_states[digest] = self.generation
+            return
+        self._cycle = (first_seen, self.generation - first_seen, [self._save_state()])
+
+    def _jump_to(self, generation):
+        """
+        Set the grid to `generation` (>= cycle start) using the detected cycle.
+        A phase not collected yet is stepped to from the last collected one,
+        which is never further than stepping from the current generation.
+        """
+        start, period, states = self._cycle
+        phase = (generation - start) % period
+        if phase < len(states):
+            self._restore_state(states[phase])
+        else:
+            if (self.generation - start) % period != len(states) - 1:
+                self._restore_state(states[-1])
+            for _ in range(phase - len(states) + 1):
+                self.step()
+                states.append(self._save_state())
+        self.generation = generation
+
+    def _save_state(self):
+        """The current generation in the compact form kept for a detected cycle."""
+        return np.packbits(self.grid)
+
+    def _restore_state(self, state):
+        """Make a _save_state() result the current generation."""
+        self.grid = np.unpackbits(state, count=self.rows * self.cols).astype(bool).reshape(self.rows, self.cols)
+
+    def _state_array(self):
+        """
+        The array holding the current generation. Engines replace it rather
+        than mutate it (frontier reuses its buffer, but only while it is the
+        same object), so a different object means the board was reassigned.
+        """
+        return self.grid
+
+    def simulate(self, iterations, detect_cycles=False, workers=1, history=None, snapshots=None):
+        """
+        Run `iterations` steps consecutively. Returns the final grid (a copy).
+
+        With workers > 1 the board is split into horizontal strips advanced by
+        that many processes over shared memory (see strip_parallel.py); the
+        result is identical to the serial engines. It is ignored when
+        detect_cycles is set, which needs every generation in this process.
+
+        With detect_cycles=True every generation is hashed; once a still life or
+        oscillator repeats, the remaining generations are computed by modular
+        arithmetic over the cycle instead of being stepped, so a run never
+        steps more generations than it was asked for. The history is kept
+        across calls, so a checkpoint loop of simulate() calls benefits too
+        (see cycle_stats). It is discarded if `grid` was reassigned since the
+        last detect_cycles run.
+
+        Pass a history.GenerationHistory as `history` to record the current
+        generation and every one stepped to, as keyframes plus XOR deltas.
+        Recording needs every generation in this process, so workers is
+        ignored then.
+
+        Pass a snapshots.RunSnapshots as `snapshots` to save the grid every
+        time the generation reaches a multiple of its interval, so a later run
+        on the same inputs can resume from there.
+        """
+        self._run(iterations, detect_cycles, workers, history, snapshots)
         return self.grid.copy()
+
+    def _run(self, iterations, detect_cycles, workers, history, snapshots):
+        """simulate() without building its result."""
+        if snapshots is not None:
+            self._simulate_with_snapshots(iterations, detect_cycles, workers, history, snapshots)
+        else:
+            self._simulate_measured(iterations, detect_cycles, workers, history)
+
+    def _simulate_measured(self, iterations, detect_cycles, workers, history):
+        """_simulate() plus the metrics bookkeeping."""
+        if self.metrics is None:
+            self._simulate(iterations, detect_cycles, workers, history)
+            return
+        computed = self._steps_computed
+        with self.metrics.phase("step"):
+            self._simulate(iterations, detect_cycles, workers, history)
+        self.metrics.count("generations", iterations)
+        self.metrics.count("steps_computed", self._steps_computed - computed)
+
+    def _simulate_with_snapshots(self, iterations, detect_cycles, workers, history, snapshots):
+        """simulate() in chunks that end on snapshot generations."""
+        target = self.generation + iterations
+        while self.generation < target:
+            chunk = min(target - self.generation, snapshots.interval - self.generation % snapshots.interval)
+            self._simulate_measured(chunk, detect_cycles, workers, history)
+            if self.generation % snapshots.interval == 0:
+                with timed(self.metrics, "snapshot"):
+                    snapshots.save(self.generation, self.grid)
+
+    def _simulate(self, iterations, detect_cycles, workers, history=None):
+        """
+        simulate() without metrics bookkeeping. With engine="auto" the run is
+        advanced in chunks of planner.check_every generations, letting the
+        planner switch engines in between; the last generation of each chunk
+        is stepped on its own so the planner sees how many cells changed.
+        Strip workers ignore the engine, so they bypass the planner.
+        """
+        per_step = detect_cycles or history is not None
+        if self.planner is None or (workers > 1 and not per_step):
+            self._advance(iterations, detect_cycles, workers, history)
+            return
+        target = self.generation + iterations
+        while self.generation < target:
+            self.planner.update(self, per_step)
+            chunk = min(target - self.generation, self.planner.check_every)
+            self._advance(chunk - 1, detect_cycles, workers, history)
+            before = self.grid.copy()
+            self._advance(1, detect_cycles, workers, history)
+            self.planner.observe(before, self.grid)
+
+    def _advance(self, iterations, detect_cycles, workers, history=None):
+        """Advance `iterations` generations with the current engine."""
+        if history is not None:
+            history.record(self.generation, self.grid)
+            for _ in range(iterations):
+                self._simulate(1, detect_cycles, 1)
+                history.record(self.generation, self.grid)
+            return
+
+        if detect_cycles:
+            if self._cycle_grid is not None and self._cycle_grid is not self._state_array():
+                # The board was replaced; what we saw no longer describes it
+                self._seen_states = {}
+                self._cycle = None
+            target = self.generation + iterations
+            while self.generation < target and self._cycle is None:
+                self._record_state()
+                if self._cycle is None:
+                    self.step()
+            if self._cycle is not None:
+                self._jump_to(target)
+            self._cycle_grid = self._state_array()
+            return
+
+        if workers > 1 and iterations > 0:
+            from strip_parallel import simulate_strips
+
+            self.grid = simulate_strips(self.grid, self.compile_wormhole_corrections(), iterations, workers)
+            self.generation += iterations
+            self._steps_computed += iterations
+            return
+
+        if self.engine == "bitboard":
+            self._run_bitboard(iterations)
+        elif self.engine == "temporal":
+            self._run_temporal(iterations)
+        elif self.engine == "sparse":
+            self._run_sparse(iterations)
+        else:
+            for _ in range(iterations):
+                self.step()
+            return
+        self.generation += iterations
+        self._steps_computed += iterations
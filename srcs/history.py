@@ -0,0 +1,231 @@
+# File: srcs/history.py
+
+import io
+import os
+import numpy as np
+from PIL import Image
+from image_utils import save_array_to_image
+
+# Zero gaps up to this many bytes are folded into the surrounding run, since
+# a new run costs two index entries.
+_RUN_MERGE_GAP = 8
+
+def encode_delta(prev, cur):
+    """
+    Run-length encode the XOR of two packed generations (np.packbits bytes).
+    Returns (starts, lengths, data): the byte ranges where they differ and
+    the XOR bytes of those ranges, concatenated.
+    """
+    diff = np.bitwise_xor(prev, cur)
+    changed = np.flatnonzero(diff)
+    index_dtype = np.uint16 if diff.size < (1 << 16) else np.uint32 if diff.size < (1 << 32) else np.int64
+    if changed.size == 0:
+        empty = np.zeros(0, dtype=index_dtype)
+        return empty, empty, np.zeros(0, dtype=np.uint8)
+    breaks = np.flatnonzero(np.diff(changed) > _RUN_MERGE_GAP) + 1
+    starts = changed[np.r_[0, breaks]]
+    ends = changed[np.r_[breaks - 1, changed.size - 1]] + 1
+    lengths = ends - starts
+    positions = _run_positions(starts, lengths)
+    return starts.astype(index_dtype), lengths.astype(index_dtype), diff[positions]
+
+def apply_delta(packed, delta):
+    """XOR an encode_delta() result into the packed generation `packed`, in place."""
+    starts, lengths, data = delta
+    if data.size:
+        packed[_run_positions(starts, lengths)] ^= data
+
+def _run_positions(starts, lengths):
+    """Flat byte positions covered by the runs, in order."""
+    starts = starts.astype(np.int64)
+    lengths = lengths.astype(np.int64)
+    run_offsets = np.cumsum(lengths) - lengths
+    return np.repeat(starts - run_offsets, lengths) + np.arange(int(lengths.sum()))
+
+class GenerationHistory:
+    """
+    Compact record of consecutive generations of one board.
+
+    Every `keyframe_interval`-th generation (counting from the first one
+    recorded) is kept whole as packed bits; the others are stored as the
+    run-length-encoded XOR against the previous generation, which for a
+    settling board is a few bytes. seek() decodes any recorded generation
+    from the nearest keyframe at or before it, and frames() decodes a range
+    one generation at a time for streaming export.
+    """
+
+    def __init__(self, shape, keyframe_interval=100):
+        if keyframe_interval <= 0:
+            raise ValueError("keyframe_interval must be positive")
+        self.rows, self.cols = shape
+        self.keyframe_interval = keyframe_interval
+        self.first = None
+        self.last = None
+        self._keyframes = {}  # generation → packed grid
+        self._deltas = []     # delta from generation first+i-1 to first+i (None at keyframes)
+        self._last_packed = None
+        self._cursor = None   # (generation, packed) of the last seek, to resume forward seeks
+
+    def __len__(self):
+        return 0 if self.first is None else self.last - self.first + 1
+
+    def __contains__(self, generation):
+        return self.first is not None and self.first <= generation <= self.last
+
+    @property
+    def nbytes(self):
+        """Bytes held by keyframes and deltas."""
+        total = sum(k.nbytes for k in self._keyframes.values())
+        for delta in self._deltas:
+            if delta is not None:
+                total += sum(part.nbytes for part in delta)
+        return total
+
+    def record(self, generation, grid):
+        """
+        Append `grid` as `generation`. Generations must be consecutive;
+        re-recording the last one is ignored, so a checkpoint loop of
+        simulate() calls can share one history.
+        """
+        if grid.shape != (self.rows, self.cols):
+            raise ValueError(f"Grid shape {grid.shape} does not match history shape {(self.rows, self.cols)}")
+        if self.last is not None:
+            if generation == self.last:
+                return
+            if generation != self.last + 1:
+                raise ValueError(f"Expected generation {self.last + 1}, got {generation}")
+
+        packed = np.packbits(grid)
+        if self.first is None:
+            self.first = generation
+        if (generation - self.first) % self.keyframe_interval == 0:
+            self._keyframes[generation] = packed
+            self._deltas.append(None)
+        else:
+            self._deltas.append(encode_delta(self._last_packed, packed))
+        self._last_packed = packed
+        self.last = generation
+
+    def _unpack(self, packed):
+        return np.unpackbits(packed, count=self.rows * self.cols).view(bool).reshape(self.rows, self.cols)
+
+    def seek(self, generation):
+        """Return the grid at `generation`, decoded from the nearest earlier keyframe."""
+        if generation not in self:
+            raise KeyError(f"Generation {generation} not recorded (have {self.first}..{self.last})")
+        keyframe = generation - (generation - self.first) % self.keyframe_interval
+        if self._cursor is not None and keyframe <= self._cursor[0] <= generation:
+            at, packed = self._cursor
+        else:
+            at, packed = keyframe, self._keyframes[keyframe].copy()
+        for g in range(at + 1, generation + 1):
+            apply_delta(packed, self._deltas[g - self.first])
+        self._cursor = (generation, packed)
+        return self._unpack(packed)
+
+    def frames(self, start=None, stop=None, step=1):
+        """
+        Yield (generation, grid) for start, start+step, … up to and including
+        `stop` (defaults: the whole history). Only one decoded generation is
+        held at a time.
+        """
+        start = self.first if start is None else start
+        stop = self.last if stop is None else stop
+        if len(self) == 0 or start > stop:
+            return
+        if start not in self or stop not in self:
+            raise KeyError(f"Range {start}..{stop} not recorded (have {self.first}..{self.last})")
+        packed = None
+        for generation in range(start, stop + 1):
+            if generation in self._keyframes:
+                packed = self._keyframes[generation].copy()
+            elif packed is None:
+                self.seek(generation)
+                packed = self._cursor[1].copy()
+            else:
+                apply_delta(packed, self._deltas[generation - self.first])
+            if (generation - start) % step == 0:
+                yield generation, self._unpack(packed)
+
+def _gif_frame_blocks(image):
+    """
+    Encode one PIL image as a GIF and return its image descriptor and LZW
+    data, with the file's global colour table moved into a local table so
+    the block can be spliced into any GIF stream.
+    """
+    buf = io.BytesIO()
+    image.save(buf, format="GIF")
+    data = buf.getvalue()
+    flags = data[10]
+    pos = 13
+    color_table = b""
+    if flags & 0x80:
+        size = 3 << ((flags & 0x07) + 1)
+        color_table, pos = data[pos:pos + size], pos + size
+
+    while data[pos] == 0x21:  # skip extensions PIL may add
+        pos += 2
+        while data[pos]:
+            pos += data[pos] + 1
+        pos += 1
+    if data[pos] != 0x2C:
+        raise ValueError("Unexpected GIF layout from PIL")
+
+    descriptor = bytearray(data[pos:pos + 10])
+    pos += 10
+    if descriptor[9] & 0x80:
+        size = 3 << ((descriptor[9] & 0x07) + 1)
+        descriptor += data[pos:pos + size]
+        pos += size
+    elif color_table:
+        descriptor[9] = (descriptor[9] & 0x78) | 0x80 | (flags & 0x07)
+        descriptor += color_table
+    # LZW minimum code size, then sub-blocks up to the zero terminator
+    end = pos + 1
+    while data[end]:
+        end += data[end] + 1
+    return bytes(descriptor) + data[pos:end + 1]
+
+def write_gif(frames, path, duration_ms=100, loop=0, scale=1):
+    """
+    Stream (generation, grid) pairs (e.g. GenerationHistory.frames()) to an
+    animated GIF at `path`, encoding and writing one frame at a time.
+    `scale` enlarges each cell to scale x scale pixels. Returns the number of
+    frames written.
+    """
+    count = 0
+    with open(path, "wb") as f:
+        for _, grid in frames:
+            img_arr = grid.astype(np.uint8) * 255
+            if scale > 1:
+                img_arr = np.repeat(np.repeat(img_arr, scale, axis=0), scale, axis=1)
+            if count == 0:
+                height, width = img_arr.shape
+                f.write(b"GIF89a")
+                f.write(width.to_bytes(2, "little") + height.to_bytes(2, "little"))
+                f.write(bytes([0x80, 0, 0]) + b"\x00\x00\x00\xff\xff\xff")  # 2-colour global table
+                # NETSCAPE2.0 looping extension
+                f.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + loop.to_bytes(2, "little") + b"\x00")
+            delay = max(1, round(duration_ms / 10)).to_bytes(2, "little")
+            f.write(b"\x21\xf9\x04\x00" + delay + b"\x00\x00")  # graphic control extension
+            f.write(_gif_frame_blocks(Image.fromarray(img_arr, mode="L")))
+            count += 1
+        if count:
+            f.write(b"\x3b")
+    if not count:
+        os.remove(path)
+        raise ValueError("No frames to write")
+    return count
+
+def write_png_sequence(frames, out_dir, pattern="{generation}.png"):
+    """
+    Write each (generation, grid) pair as its own PNG in `out_dir`, named by
+    `pattern`. Returns the paths written.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for generation, grid in frames:
+        path = os.path.join(out_dir, pattern.format(generation=generation))
+        save_array_to_image(grid, path)
+        paths.append(path)
+    return paths
@@ -1,8 +1,23 @@
 # File: srcs/image_utils.py
 
+import os
+import struct
 from PIL import Image
 import numpy as np
 
+# ─── Raw grid format ──────────────────────────────────────────
+# A fixed header page followed by the cells, row-major:
+#   "uint8": one byte per cell (0 = dead, 1 = alive), memory-mapped as-is
+#   "bits":  np.packbits rows, ceil(cols / 8) bytes each (MSB first)
+# The header is a whole page so the cell data is page-aligned on disk.
+RAW_MAGIC = b"GOLGRID\0"
+RAW_VERSION = 1
+RAW_HEADER_SIZE = 4096
+RAW_PAGE_SIZE = 4096
+RAW_ENCODINGS = {"uint8": 0, "bits": 1}
+_HEADER = struct.Struct("<8sIIQQ")  # magic, version, encoding, rows, cols
+_COMPARE_BLOCK = 1 << 24  # bytes compared at a time when rewriting in place
+
 def load_binary_image_to_array(path):
     """
     Load a black/white PNG from `path` and return a 2D boolean numpy array:
@@ -31,3 +46,104 @@ def load_color_image(path):
     """
     img = Image.open(path).convert("RGB")
     return np.array(img, dtype=np.uint8)
+
+def _raw_payload_shape(rows, cols, encoding):
+    return (rows, cols) if encoding == "uint8" else (rows, (cols + 7) // 8)
+
+def read_raw_header(path):
+    """Return (rows, cols, encoding) from the header of a raw grid file."""
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise ValueError(f"{path}: too short to be a raw grid")
+    magic, version, code, rows, cols = _HEADER.unpack(header)
+    if magic != RAW_MAGIC:
+        raise ValueError(f"{path}: not a raw grid (bad magic {magic!r})")
+    if version != RAW_VERSION:
+        raise ValueError(f"{path}: unsupported raw grid version {version}")
+    encodings = {v: k for k, v in RAW_ENCODINGS.items()}
+    if code not in encodings:
+        raise ValueError(f"{path}: unknown raw grid encoding {code}")
+    encoding = encodings[code]
+    expected = RAW_HEADER_SIZE + int(np.prod(_raw_payload_shape(rows, cols, encoding)))
+    if os.path.getsize(path) != expected:
+        raise ValueError(f"{path}: size {os.path.getsize(path)} does not match a {rows}x{cols} {encoding} grid")
+    return rows, cols, encoding
+
+def load_raw_grid(path):
+    """
+    Load a raw grid file as a 2D boolean array.
+    A "uint8" file is returned as a read-only np.memmap viewed as bool, so
+    nothing is read until it is used (zero-copy). A "bits" file is unpacked
+    into memory.
+    """
+    rows, cols, encoding = read_raw_header(path)
+    cells = np.memmap(path, dtype=np.uint8, mode="r", offset=RAW_HEADER_SIZE,
+                      shape=_raw_payload_shape(rows, cols, encoding))
+    if encoding == "uint8":
+        return cells.view(bool)
+    return np.unpackbits(cells, axis=1, count=cols).view(bool)
+
+def save_raw_grid(arr, path, encoding="uint8"):
+    """
+    Write the 2D boolean array `arr` to `path` as a raw grid and return the
+    number of data pages written.
+
+    If `path` already holds a raw grid of the same shape and encoding, it is
+    updated in place through a memory map and only the pages whose bytes
+    changed are written, so rewriting a mostly unchanged checkpoint is cheap.
+    Otherwise the file is written from scratch.
+    """
+    if encoding not in RAW_ENCODINGS:
+        raise ValueError(f"Unknown raw grid encoding '{encoding}', expected one of {sorted(RAW_ENCODINGS)}")
+    arr = np.ascontiguousarray(arr, dtype=bool)
+    rows, cols = arr.shape
+    payload = arr.view(np.uint8) if encoding == "uint8" else np.packbits(arr, axis=1)
+
+    try:
+        same_layout = read_raw_header(path) == (rows, cols, encoding)
+    except (OSError, ValueError):
+        same_layout = False
+    if not same_layout:
+        with open(path, "wb") as f:
+            header = _HEADER.pack(RAW_MAGIC, RAW_VERSION, RAW_ENCODINGS[encoding], rows, cols)
+            f.write(header.ljust(RAW_HEADER_SIZE, b"\0"))
+            f.write(payload.tobytes())
+        return -(-payload.size // RAW_PAGE_SIZE)
+
+    if payload.size == 0:
+        return 0
+    cells = np.memmap(path, dtype=np.uint8, mode="r+", offset=RAW_HEADER_SIZE, shape=(payload.size,))
+    new = payload.reshape(-1)
+    written = 0
+    for start in range(0, new.size, _COMPARE_BLOCK):
+        stop = min(start + _COMPARE_BLOCK, new.size)
+        changed = np.flatnonzero(cells[start:stop] != new[start:stop])
+        for page in np.unique((start + changed) // RAW_PAGE_SIZE).tolist():
+            lo, hi = page * RAW_PAGE_SIZE, min((page + 1) * RAW_PAGE_SIZE, new.size)
+            cells[lo:hi] = new[lo:hi]
+            written += 1
+    cells.flush()
+    del cells
+    return written
+
+def load_grid(path):
+    """Load a starting position or checkpoint from a .png or .raw file."""
+    if path.endswith(".raw"):
+        return load_raw_grid(path)
+    return load_binary_image_to_array(path)
+
+def save_grid(arr, path):
+    """Save `arr` as a raw grid if `path` ends in .raw, otherwise as a PNG."""
+    if path.endswith(".raw"):
+        save_raw_grid(arr, path)
+    else:
+        save_array_to_image(arr, path)
+
+def png_to_raw(png_path, raw_path, encoding="uint8"):
+    """Convert a black/white PNG grid to the raw format."""
+    save_raw_grid(load_binary_image_to_array(png_path), raw_path, encoding)
+
+def raw_to_png(raw_path, png_path):
+    """Convert a raw grid back to a black/white PNG."""
+    save_array_to_image(load_raw_grid(raw_path), png_path)
@@ -0,0 +1,373 @@
+# File: srcs/job_server.py
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from PIL import Image
+from checkpoint_writer import parse_checkpoints
+from game_of_life import ENGINES, GameOfLifeWormhole
+from metrics import RunMetrics, timed
+from wormhole_parser import parse_wormholes_from_color_map
+
+RESULT_ENCODINGS = ("png", "packed")
+_IMAGE_FIELDS = ("starting_position", "horizontal_tunnel", "vertical_tunnel")
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+class JobError(Exception):
+    """A job that cannot be accepted; carries the HTTP status to answer with."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+# ─── Worker side ──────────────────────────────────────────────
+# Each pool process keeps its compiled topologies, so repeated jobs over the
+# same tunnel maps skip decoding, parsing and compiling.
+_TOPOLOGIES = OrderedDict()
+_MAX_TOPOLOGIES = 16
+
+def _decode_png(data, mode):
+    return np.array(Image.open(io.BytesIO(data)).convert(mode), dtype=np.uint8)
+
+def _encode_grid(grid, encoding):
+    if encoding == "packed":
+        return base64.b64encode(np.packbits(grid).tobytes()).decode("ascii")
+    buf = io.BytesIO()
+    Image.fromarray(grid.astype(np.uint8) * 255, mode="L").save(buf, format="PNG")
+    return base64.b64encode(buf.getvalue()).decode("ascii")
+
+def _topology(h_png, v_png, shape, metrics):
+    """Return (h_wormholes, v_wormholes, neighbor_table, corrections, warm) for this process."""
+    key = (hashlib.sha256(h_png).hexdigest(), hashlib.sha256(v_png).hexdigest(), shape)
+    cached = _TOPOLOGIES.get(key)
+    if cached is not None:
+        _TOPOLOGIES.move_to_end(key)
+        return cached + (True,)
+
+    with timed(metrics, "decode_tunnels"):
+        h_arr = _decode_png(h_png, "RGB")
+        v_arr = _decode_png(v_png, "RGB")
+    with timed(metrics, "parse"):
+        h_wormholes = parse_wormholes_from_color_map(h_arr)
+        v_wormholes = parse_wormholes_from_color_map(v_arr)
+    with timed(metrics, "compile"):
+        topology = GameOfLifeWormhole(np.zeros(shape, dtype=bool), h_wormholes, v_wormholes)
+        table = topology.compile_neighbor_table()
+        corrections = topology.compile_wormhole_corrections()  # cached by the table build
+    _TOPOLOGIES[key] = (h_wormholes, v_wormholes, table, corrections)
+    if len(_TOPOLOGIES) > _MAX_TOPOLOGIES:
+        _TOPOLOGIES.popitem(last=False)
+    return h_wormholes, v_wormholes, table, corrections, False
+
+def run_job(job):
+    """
+    Pool entry point: simulate one decoded job dict (the three PNGs as bytes,
+    checkpoints as a sorted list) and return its JSON-ready result.
+    """
+    start = time.perf_counter()
+    metrics = RunMetrics()
+    with timed(metrics, "decode"):
+        grid = _decode_png(job["starting_position"], "L") > 0
+    h, v, table, corrections, warm = _topology(job["horizontal_tunnel"], job["vertical_tunnel"], grid.shape, metrics)
+
+    gol = GameOfLifeWormhole(grid, h, v, engine=job["engine"], neighbor_table=table, corrections=corrections,
+                             metrics=metrics)
+    results = {}
+    prev = 0
+    for it in job["checkpoints"]:
+        gol.simulate(it - prev, detect_cycles=job["detect_cycles"])
+        prev = it
+        with timed(metrics, "encode"):
+            results[str(it)] = _encode_grid(gol.grid, job["encoding"])
+
+    report = metrics.to_dict()
+    return {
+        "shape": list(grid.shape),
+        "encoding": job["encoding"],
+        "checkpoints": results,
+        "cycle": gol.cycle_stats,
+        "engine": gol.engine,
+        "worker": {"pid": os.getpid(), "topology": "warm" if warm else "cold"},
+        "timing": {"run_seconds": time.perf_counter() - start, "phases": report["phases"]},
+    }
+
+def _warm_worker():
+    """Pool initializer: pay the imports and first NumPy calls before any job arrives."""
+    GameOfLifeWormhole(np.zeros((3, 3), dtype=bool)).simulate(1)
+
+# ─── Server side ──────────────────────────────────────────────
+def parse_job(payload):
+    """
+    Validate a request body and return (content_key, job). The body is a
+    JSON object with base64 PNGs under starting_position, horizontal_tunnel
+    and vertical_tunnel, plus optional checkpoints (any parse_checkpoints
+    spec, default [1, 10, 100, 1000]), detect_cycles (default true),
+    encoding ("png" or "packed" np.packbits bytes, default "png") and engine
+    ("auto" or one of ENGINES, default "auto").
+    """
+    try:
+        body = json.loads(payload)
+    except (UnicodeDecodeError, json.JSONDecodeError) as err:
+        raise JobError(400, f"Body is not JSON: {err}") from None
+    if not isinstance(body, dict):
+        raise JobError(400, "Body must be a JSON object")
+
+    job = {}
+    for field in _IMAGE_FIELDS:
+        if not isinstance(body.get(field), str):
+            raise JobError(400, f"Missing base64 PNG field '{field}'")
+        try:
+            job[field] = base64.b64decode(body[field], validate=True)
+        except ValueError:
+            raise JobError(400, f"Field '{field}' is not valid base64") from None
+        try:
+            Image.open(io.BytesIO(job[field])).verify()
+        except (OSError, SyntaxError, ValueError) as err:
+            raise JobError(400, f"Field '{field}' is not a readable image: {err}") from None
+    try:
+        job["checkpoints"] = parse_checkpoints(body.get("checkpoints", [1, 10, 100, 1000]))
+    except (TypeError, ValueError) as err:
+        raise JobError(400, f"Bad checkpoints: {err}") from None
+    job["detect_cycles"] = bool(body.get("detect_cycles", True))
+    job["encoding"] = body.get("encoding", "png")
+    if job["encoding"] not in RESULT_ENCODINGS:
+        raise JobError(400, f"encoding must be one of {RESULT_ENCODINGS}")
+    job["engine"] = body.get("engine", "auto")
+    if job["engine"] != "auto" and job["engine"] not in ENGINES:
+        raise JobError(400, f"engine must be 'auto' or one of {ENGINES}")
+
+    digest = hashlib.sha256()
+    for field in _IMAGE_FIELDS:
+        digest.update(hashlib.sha256(job[field]).digest())
+    options = {k: job[k] for k in ("checkpoints", "detect_cycles", "encoding", "engine")}
+    digest.update(json.dumps(options, sort_keys=True).encode())
+    return digest.hexdigest(), job
+
+class JobServer:
+    """
+    asyncio HTTP/1.1 front end for a warm pool of simulation processes.
+
+      POST /jobs   run a job (see parse_job) and answer with its checkpoint
+                   grids and timing
+      GET  /stats  queue depth, cache and dedup counters
+
+    Results are cached by a SHA-256 of the job's content, and identical jobs
+    that arrive while one is running wait for it instead of running again.
+    At most `max_queue` distinct jobs may be queued or running; beyond that
+    new jobs get 503 with Retry-After so callers back off.
+    """
+
+    def __init__(self, workers=2, max_queue=16, cache_entries=128, max_body=256 << 20):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.cache_entries = cache_entries
+        self.max_body = max_body
+        self._pool = None
+        self._server = None
+        self._cache = OrderedDict()  # content key → result
+        self._in_flight = {}         # content key → asyncio.Future
+        self.stats = {"jobs": 0, "runs": 0, "cache_hits": 0, "deduplicated": 0, "rejected": 0, "failed": 0}
+        self.address = None
+
+    async def start(self, host="127.0.0.1", port=0, unix_path=None):
+        """Start the pool and listen on host:port (port 0 picks a free one) or a Unix socket."""
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+        # Processes are spawned on demand; start them all now so no request pays for it
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._pool, os.getpid) for _ in range(self.workers)))
+        if unix_path:
+            self._server = await asyncio.start_unix_server(self._handle, path=unix_path)
+            self.address = unix_path
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+            self.address = self._server.sockets[0].getsockname()[:2]
+        return self.address
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+    @property
+    def queue_depth(self):
+        """Distinct jobs currently queued or running."""
+        return len(self._in_flight)
+
+    async def submit(self, key, job):
+        """
+        Return (result, how) for a parsed job, where how is "cache",
+        "deduplicated" or "run". Raises JobError(503) when the queue is full.
+        """
+        self.stats["jobs"] += 1
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return self._cache[key], "cache"
+        if key in self._in_flight:
+            self.stats["deduplicated"] += 1
+            return await asyncio.shield(self._in_flight[key]), "deduplicated"
+        if self.queue_depth >= self.max_queue:
+            self.stats["rejected"] += 1
+            raise JobError(503, f"Queue full ({self.max_queue} jobs); retry later")
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            self.stats["runs"] += 1
+            result = await asyncio.get_running_loop().run_in_executor(self._pool, run_job, job)
+        except BaseException as err:
+            self.stats["failed"] += 1
+            future.set_exception(err)
+            future.exception()  # mark retrieved when nobody else was waiting
+            raise
+        else:
+            future.set_result(result)
+            self._cache[key] = result
+            if len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+            return result, "run"
+        finally:
+            del self._in_flight[key]
+
+    async def _handle(self, reader, writer):
+        try:
+            status, body, headers = await self._respond(reader)
+        except Exception as err:
+            status, body, headers = 500, {"error": f"{type(err).__name__}: {err}"}, {}
+        data = json.dumps(body).encode()
+        head = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}", "Content-Type: application/json",
+                f"Content-Length: {len(data)}", "Connection: close"]
+        head += [f"{k}: {v}" for k, v in headers.items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + data)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _respond(self, reader):
+        """Read one request and return (status, JSON body, extra headers)."""
+        arrived = time.perf_counter()
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) < 2:
+            return 400, {"error": "Malformed request line"}, {}
+        method, path = request_line[0], request_line[1]
+        length = 0
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "content-length":
+                try:
+                    length = int(value.strip())
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    return 400, {"error": f"Bad Content-Length '{value.strip()}'"}, {}
+
+        if path == "/stats":
+            return 200, dict(self.stats, queue_depth=self.queue_depth, cached_results=len(self._cache)), {}
+        if path != "/jobs":
+            return 404, {"error": f"No route {path}"}, {}
+        if method != "POST":
+            return 405, {"error": "Use POST /jobs"}, {"Allow": "POST"}
+        if length > self.max_body:
+            return 413, {"error": f"Body over {self.max_body} bytes"}, {}
+
+        try:
+            payload = await reader.readexactly(length)
+        except asyncio.IncompleteReadError as err:
+            return 400, {"error": f"Body ended after {len(err.partial)} of {length} bytes"}, {}
+        try:
+            key, job = parse_job(payload)
+            accepted = time.perf_counter()
+            result, how = await self.submit(key, job)
+        except JobError as err:
+            headers = {"Retry-After": "1"} if err.status == 503 else {}
+            return err.status, {"error": str(err)}, headers
+        done = time.perf_counter()
+        # run_seconds and phases describe the run that produced the result,
+        # which for "cache" and "deduplicated" was another request's.
+        timing = dict(result["timing"], parse_request_seconds=accepted - arrived, total_seconds=done - arrived)
+        if how == "run":
+            timing["queued_seconds"] = max(0.0, done - accepted - result["timing"]["run_seconds"])
+        return 200, dict(result, job=key, source=how, timing=timing), {}
+
+async def request(method, path, body=None, host="127.0.0.1", port=None, unix_path=None):
+    """
+    Minimal client for JobServer: send one request and return (status, JSON).
+    `body` is JSON-encoded when given.
+    """
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(data)}\r\n\r\n".encode() + data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+def job_from_case(case_dir, **options):
+    """Build a request body from a data/<case> folder's three PNGs."""
+    body = dict(options)
+    for field in _IMAGE_FIELDS:
+        with open(os.path.join(case_dir, f"{field}.png"), "rb") as f:
+            body[field] = base64.b64encode(f.read()).decode("ascii")
+    return body
+
+def decode_result_grid(result, checkpoint):
+    """Turn one checkpoint of a job response back into a boolean grid."""
+    data = base64.b64decode(result["checkpoints"][str(checkpoint)])
+    if result["encoding"] == "packed":
+        rows, cols = result["shape"]
+        return np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=rows * cols).view(bool).reshape(rows, cols)
+    return _decode_png(data, "L") > 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Game of Life with wormholes jobs over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", default=None, help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=0, help="simulation processes (0 = one per CPU)")
+    parser.add_argument("--max-queue", type=int, default=16, help="distinct jobs queued or running before 503")
+    parser.add_argument("--cache-entries", type=int, default=128, help="results kept in the content-hash cache")
+    args = parser.parse_args(argv)
+
+    async def serve():
+        server = JobServer(args.workers or os.cpu_count(), args.max_queue, args.cache_entries)
+        async with server:
+            address = await server.start(args.host, args.port, args.unix_socket)
+            print(f"Job server listening on {address} with {server.workers} worker(s)")
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,73 @@
 # File: srcs/main.py
 
+import argparse
+import json
 import os
 import sys
-from image_utils import (
-    load_binary_image_to_array,
-    save_array_to_image,
-    load_color_image
-)
-from wormhole_parser import parse_wormholes_from_color_map
-from game_of_life import GameOfLifeWormhole
-
-def process_one_case(case_name, data_dir, output_base_dir):
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from image_utils import load_grid
+from checkpoint_writer import DEFAULT_CHECKPOINTS, CheckpointWriter, parse_checkpoints
+from game_of_life import ENGINES, GameOfLifeWormhole
+from topology_cache import TopologyCache, load_topology
+from metrics import RunMetrics, timed
+from snapshots import RunSnapshots
+
+GRID_FORMATS = ("png", "raw")
+
+def process_one_case(case_name, data_dir, output_base_dir, detect_cycles=True, cache_dir=None,
+                     checkpoints=None, metrics=None, grid_format="png", snapshot_dir=None,
+                     snapshot_interval=100, engine="auto"):
     """
     Process a single folder under data/ named `case_name`.
     Expects:
-      - data/<case_name>/starting_position.png
+      - data/<case_name>/starting_position.png (or .raw)
       - data/<case_name>/horizontal_tunnel.png
       - data/<case_name>/vertical_tunnel.png
 
-    Saves:
-      output_base_dir/<case_name>/1.png
-      output_base_dir/<case_name>/10.png
-      output_base_dir/<case_name>/100.png
-      output_base_dir/<case_name>/1000.png
+    Saves output_base_dir/<case_name>/<N>.png for every checkpoint N, by
+    default 1, 10, 100 and 1000. `checkpoints` may be any spec accepted by
+    parse_checkpoints (a list of generations or a string like "every:50:1000").
+    PNGs are encoded on a background CheckpointWriter while stepping continues.
+
+    With detect_cycles=True (default), once the board settles into a still
+    life or oscillator the remaining checkpoints are computed from the cycle
+    instead of being stepped.
+
+    With cache_dir set, the parsed wormholes and compiled neighbor table are
+    kept in a TopologyCache there, keyed by the tunnel images' content, so
+    later runs against the same tunnel pair skip parsing.
+
+    With grid_format="raw", the starting position is read from
+    starting_position.raw when present (memory-mapped, see image_utils) and
+    checkpoints are written as <N>.raw, updating only changed pages of an
+    existing file. Either format falls back to the other starting file.
+
+    With snapshot_dir set, the grid is snapshotted there every
+    `snapshot_interval` generations and at every checkpoint (see
+    snapshots.RunSnapshots). A later run with the same starting grid and
+    tunnels resumes from the newest snapshot up to its last checkpoint,
+    writing the earlier checkpoints from their snapshots instead of
+    re-stepping them.
+
+    `engine` is passed to GameOfLifeWormhole: "auto" (default) lets the
+    engine planner pick from the board size, density and portal count and
+    switch as the density changes, logging each decision; any name in
+    ENGINES forces that engine for the whole run.
+
+    Pass a RunMetrics as `metrics` to record wall time per phase (decode,
+    decode_tunnels, parse, compile, topology_cache, step, encode, and
+    wait_for_writer, the time spent draining the writer), wormhole counts per
+    axis and the live-cell count at every checkpoint.
     """
-    start_path    = os.path.join(data_dir, case_name, "starting_position.png")
+    if grid_format not in GRID_FORMATS:
+        raise ValueError(f"Unknown grid format '{grid_format}', expected one of {GRID_FORMATS}")
+    start_candidates = [
+        os.path.join(data_dir, case_name, f"starting_position.{ext}")
+        for ext in sorted(GRID_FORMATS, key=lambda ext: ext != grid_format)
+    ]
+    start_path    = next((p for p in start_candidates if os.path.isfile(p)), start_candidates[0])
     h_tunnel_path = os.path.join(data_dir, case_name, "horizontal_tunnel.png")
     v_tunnel_path = os.path.join(data_dir, case_name, "vertical_tunnel.png")
 
@@ -36,30 +79,148 @@ def process_one_case(case_name, data_dir, output_base_dir):
     os.makedirs(out_dir, exist_ok=True)
 
     # 1) Load the starting grid
-    grid = load_binary_image_to_array(start_path)
+    with timed(metrics, "decode"):
+        grid = load_grid(start_path)
 
-    # 2) Load tunnel images and parse wormholes
-    h_arr = load_color_image(h_tunnel_path)
-    v_arr = load_color_image(v_tunnel_path)
-    h_wormholes = parse_wormholes_from_color_map(h_arr)
-    v_wormholes = parse_wormholes_from_color_map(v_arr)
+    # 2) Load tunnel images and parse wormholes (or fetch them from the cache)
+    cache = TopologyCache(cache_dir) if cache_dir else None
+    h_wormholes, v_wormholes, neighbor_table, corrections = load_topology(
+        h_tunnel_path, v_tunnel_path, grid.shape, cache, metrics=metrics
+    )
+    if metrics is not None:
+        metrics.set("rows", grid.shape[0])
+        metrics.set("cols", grid.shape[1])
+        metrics.set("h_portal_cells", len(h_wormholes))
+        metrics.set("v_portal_cells", len(v_wormholes))
 
     # 3) Initialize simulator
-    gol = GameOfLifeWormhole(grid, h_wormholes, v_wormholes)
+    gol = GameOfLifeWormhole(
+        grid, h_wormholes, v_wormholes, engine=engine, neighbor_table=neighbor_table,
+        corrections=corrections, metrics=metrics,
+    )
 
-    # 4) Checkpoints: 1, 10, 100, 1000
-    checkpoints = [1, 10, 100, 1000]
-    prev_iter = 0
-    for it in checkpoints:
-        steps = it - prev_iter
-        gol.simulate(steps)
-        prev_iter = it
+    # 4) Checkpoints (default: 1, 10, 100, 1000), written in the background
+    checkpoints = parse_checkpoints(DEFAULT_CHECKPOINTS if checkpoints is None else checkpoints)
+    snapshots = None
+    resumed = 0
+    if snapshot_dir:
+        snapshots = RunSnapshots(snapshot_dir, grid, h_wormholes, v_wormholes, interval=snapshot_interval)
+        with timed(metrics, "snapshot"):
+            resumed = snapshots.resume(gol, max_generation=checkpoints[-1], required=checkpoints)
+        if metrics is not None:
+            metrics.set("resumed_from", resumed)
+    prev_iter = resumed
+    writer = CheckpointWriter(metrics=metrics)
+    with writer:
+        for it in checkpoints:
+            if it <= resumed:
+                with timed(metrics, "snapshot"):
+                    checkpoint_grid = snapshots.load(it)
+                if checkpoint_grid is None:
+                    raise RuntimeError(f"Snapshot for generation {it} disappeared while resuming")
+            else:
+                steps = it - prev_iter
+                gol.simulate(steps, detect_cycles=detect_cycles, snapshots=snapshots)
+                prev_iter = it
+                if snapshots is not None:
+                    with timed(metrics, "snapshot"):
+                        snapshots.save(it, gol.grid)
+                checkpoint_grid = gol.grid
+            if metrics is not None:
+                metrics.record_checkpoint(it, int(checkpoint_grid.sum()))
 
-        out_path = os.path.join(out_dir, f"{it}.png")
-        save_array_to_image(gol.grid, out_path)
-        print(f"[{case_name}] → Saved iteration {it} at: {out_path}")
+            writer.submit(checkpoint_grid, os.path.join(out_dir, f"{it}.{grid_format}"))
+        with timed(metrics, "wait_for_writer"):
+            saved = writer.close()
+    # Reported here rather than from the writer threads, so lines stay whole and in order
+    for it, path in zip(checkpoints, saved):
+        print(f"[{case_name}] → Saved iteration {it} at: {path}")
 
-def main():
+    stats = gol.cycle_stats
+    if stats["detected"]:
+        print(
+            f"[{case_name}] Cycle detected: period {stats['period']} from generation {stats['start']} "
+            f"(stepped {stats['steps_computed']} of {stats['generation']} generations)"
+        )
+
+def _run_case(case_name, data_dir, output_dir, case_options, collect_metrics=False):
+    """
+    Worker entry point for the process pool: run one case and report back
+    (case_name, status, message, seconds, metrics) instead of raising, where
+    status is "ok", "skipped" (missing files, as in the serial loop) or
+    "failed", and metrics is a RunMetrics.to_dict() or None.
+    """
+    metrics = RunMetrics() if collect_metrics else None
+    start = time.perf_counter()
+    try:
+        process_one_case(case_name, data_dir, output_dir, metrics=metrics, **case_options)
+    except FileNotFoundError as err:
+        return case_name, "skipped", str(err), time.perf_counter() - start, None
+    except Exception:
+        return case_name, "failed", traceback.format_exc(), time.perf_counter() - start, None
+    return case_name, "ok", "", time.perf_counter() - start, metrics and metrics.to_dict()
+
+def run_cases_parallel(case_names, data_dir, output_dir, workers, collect_metrics=False, **case_options):
+    """
+    Run process_one_case for every name in `case_names` across a pool of
+    `workers` processes, passing `case_options` through as keyword arguments.
+    Progress is printed as each case finishes; the returned list of
+    (case_name, status, message, seconds, metrics) is in the order of
+    `case_names`, regardless of completion order.
+    """
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_case, name, data_dir, output_dir, case_options, collect_metrics)
+            for name in case_names
+        ]
+        for done, future in enumerate(as_completed(futures), start=1):
+            result = future.result()
+            name, status, message, seconds, _ = result
+            results[name] = result
+            print(f"[{done}/{len(futures)}] {name}: {status} ({seconds:.2f}s)")
+            if status == "failed":
+                print(message)
+    return [results[name] for name in case_names]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run Game of Life with wormholes on every data/problem-* case.")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="number of worker processes; 1 runs cases serially in this process, 0 uses all CPUs",
+    )
+    parser.add_argument(
+        "--cache-dir", default=None,
+        help="directory for the on-disk cache of parsed wormhole topologies (disabled if omitted)",
+    )
+    parser.add_argument(
+        "--checkpoints", default=None,
+        help='generations to save, e.g. "1,10,100,1000" (default) or "every:50:1000"',
+    )
+    parser.add_argument(
+        "--format", dest="grid_format", choices=GRID_FORMATS, default="png",
+        help="checkpoint file format; raw also prefers data/<case>/starting_position.raw as input",
+    )
+    parser.add_argument(
+        "--snapshot-dir", default=None,
+        help="save resumable snapshots here and continue from the latest matching one (disabled if omitted)",
+    )
+    parser.add_argument(
+        "--snapshot-interval", type=int, default=100,
+        help="generations between snapshots (checkpoints are always snapshotted)",
+    )
+    parser.add_argument(
+        "--engine", choices=("auto",) + ENGINES, default="auto",
+        help="stepping engine; auto picks one per case from board size, density and portals",
+    )
+    parser.add_argument(
+        "--metrics", default=None, metavar="OUT_JSON",
+        help="write per-case phase timings and counters to this JSON file",
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
     base_dir   = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
     data_dir   = os.path.join(base_dir, "data")
     output_dir = os.path.join(base_dir, "output")
@@ -71,17 +232,52 @@ def main():
     os.makedirs(output_dir, exist_ok=True)
 
     # Only run problem-*; skip example-* in normal runs
-    for entry in sorted(os.listdir(data_dir)):
-        entry_path = os.path.join(data_dir, entry)
-        if not os.path.isdir(entry_path):
-            continue
-        if not entry.startswith("problem-"):
-            continue
-
-        try:
-            process_one_case(entry, data_dir, output_dir)
-        except FileNotFoundError as err:
-            print(f"Skipping '{entry}': {err}")
+    cases = [
+        entry for entry in sorted(os.listdir(data_dir))
+        if os.path.isdir(os.path.join(data_dir, entry)) and entry.startswith("problem-")
+    ]
+
+    case_options = {
+        "cache_dir": args.cache_dir,
+        "checkpoints": args.checkpoints,
+        "grid_format": args.grid_format,
+        "snapshot_dir": args.snapshot_dir,
+        "snapshot_interval": args.snapshot_interval,
+        "engine": args.engine,
+    }
+    workers = args.workers if args.workers > 0 else os.cpu_count()
+    all_metrics = {}
+    failed = False
+    if workers == 1:
+        for entry in cases:
+            metrics = RunMetrics() if args.metrics else None
+            try:
+                process_one_case(entry, data_dir, output_dir, metrics=metrics, **case_options)
+            except FileNotFoundError as err:
+                print(f"Skipping '{entry}': {err}")
+                continue
+            if metrics is not None:
+                all_metrics[entry] = metrics.to_dict()
+    else:
+        results = run_cases_parallel(
+            cases, data_dir, output_dir, workers, collect_metrics=bool(args.metrics), **case_options
+        )
+        print("\nSummary:")
+        for name, status, message, seconds, metrics in results:
+            line = f"  {name}: {status} ({seconds:.2f}s)"
+            if status == "skipped":
+                line += f" – {message}"
+            print(line)
+            if metrics is not None:
+                all_metrics[name] = metrics
+        failed = any(status == "failed" for _, status, _, _, _ in results)
+
+    if args.metrics:
+        with open(args.metrics, "w") as f:
+            json.dump(all_metrics, f, indent=2)
+        print(f"Wrote metrics for {len(all_metrics)} case(s) to {args.metrics}")
+    if failed:
+        sys.exit(1)
 
     print("✅ Done processing all problem-* cases.")
 
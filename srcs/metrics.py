@@ -0,0 +1,68 @@
+# File: srcs/metrics.py
+
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+_NO_METRICS = nullcontext()
+
+def timed(metrics, name):
+    """
+    `with timed(metrics, "parse"): …` times the block into `metrics` if it is
+    a RunMetrics, and is a shared no-op context when metrics is None.
+    """
+    return _NO_METRICS if metrics is None else metrics.phase(name)
+
+class RunMetrics:
+    """
+    Collects wall time per named phase, counters, and per-checkpoint samples
+    for one simulation run. Safe to update from the checkpoint writer's
+    threads. Code that accepts `metrics=None` skips all bookkeeping, so
+    instrumentation costs nothing when it is not requested.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.counters = {}
+        self.checkpoints = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """Add the wall time of the `with` block to phase `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds):
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count(self, name, value=1):
+        """Add `value` to counter `name`."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def set(self, name, value):
+        """Overwrite counter `name` with `value`."""
+        with self._lock:
+            self.counters[name] = value
+
+    def record_checkpoint(self, generation, live_cells):
+        with self._lock:
+            self.checkpoints.append({"generation": generation, "live_cells": live_cells})
+
+    def to_dict(self):
+        """Plain-JSON view of everything recorded, plus generations/second."""
+        with self._lock:
+            out = {
+                "phases": dict(self.phases),
+                "counters": dict(self.counters),
+                "checkpoints": list(self.checkpoints),
+            }
+        step_seconds = out["phases"].get("step", 0.0)
+        generations = out["counters"].get("generations", 0)
+        out["generations_per_second"] = generations / step_seconds if step_seconds > 0 else None
+        return out
@@ -0,0 +1,169 @@
+# File: srcs/snapshots.py
+
+import hashlib
+import os
+import tempfile
+import zipfile
+import numpy as np
+
+def grid_hash(grid):
+    """SHA-256 hex digest of a boolean grid (shape + packed cells)."""
+    digest = hashlib.sha256()
+    digest.update(np.asarray(grid.shape, dtype=np.int64).tobytes())
+    digest.update(np.packbits(grid).tobytes())
+    return digest.hexdigest()
+
+def topology_hash(h_wormholes, v_wormholes):
+    """SHA-256 hex digest of the two portal maps, independent of insertion order."""
+    digest = hashlib.sha256()
+    for holes in (h_wormholes or {}, v_wormholes or {}):
+        pairs = np.array(sorted(holes.items()), dtype=np.int64).reshape(-1, 4)
+        digest.update(len(pairs).to_bytes(8, "little"))
+        digest.update(pairs.tobytes())
+    return digest.hexdigest()
+
+class RunSnapshots:
+    """
+    Snapshots of one run (a starting grid on a wormhole topology), so a later
+    run with the same inputs can continue from a saved generation instead of
+    generation 0.
+
+    Each snapshot is directory/<start>-<topology>/<generation>.npz holding the
+    packed grid, its shape, the generation and the full starting-grid and
+    topology hashes, which are checked again on load. Files are written to a
+    temp file, fsynced and renamed into place, so a crash mid-write leaves
+    either the previous state or a complete snapshot, never a torn one.
+    Pass it to GameOfLifeWormhole.simulate(..., snapshots=...) to save every
+    `interval` generations.
+    """
+
+    def __init__(self, directory, start_grid, h_wormholes=None, v_wormholes=None, interval=100, verbose=True):
+        if interval <= 0:
+            raise ValueError("Snapshot interval must be positive")
+        self.start_hash = grid_hash(start_grid)
+        self.topology_hash = topology_hash(h_wormholes, v_wormholes)
+        self.shape = start_grid.shape
+        self.interval = interval
+        self.verbose = verbose
+        self.directory = os.path.join(directory, f"{self.start_hash[:16]}-{self.topology_hash[:16]}")
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _log(self, message):
+        if self.verbose:
+            print(f"[snapshots] {message}")
+
+    def _path(self, generation):
+        return os.path.join(self.directory, f"{generation}.npz")
+
+    def generations(self):
+        """Sorted generations that have a snapshot file (not yet validated)."""
+        found = []
+        for name in os.listdir(self.directory):
+            stem, ext = os.path.splitext(name)
+            if ext == ".npz" and stem.isdigit():
+                found.append(int(stem))
+        return sorted(found)
+
+    def save(self, generation, grid):
+        """Atomically write the snapshot for `generation` unless it already exists."""
+        path = self._path(generation)
+        if os.path.exists(path):
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    packed=np.packbits(grid),
+                    shape=np.asarray(grid.shape, dtype=np.int64),
+                    generation=np.int64(generation),
+                    start_hash=np.array(self.start_hash),
+                    topology_hash=np.array(self.topology_hash),
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        # Make the rename itself durable
+        dir_fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def load(self, generation):
+        """
+        Return the grid saved for `generation`, or None if there is none.
+        Unreadable or mismatched snapshots are deleted and count as missing.
+        """
+        path = self._path(generation)
+        try:
+            with np.load(path) as data:
+                ok = (
+                    str(data["start_hash"]) == self.start_hash
+                    and str(data["topology_hash"]) == self.topology_hash
+                    and int(data["generation"]) == generation
+                    and tuple(data["shape"].tolist()) == self.shape
+                )
+                packed = data["packed"]
+        except FileNotFoundError:
+            return None
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile) as err:
+            self._log(f"dropping unreadable snapshot {path}: {err}")
+            self._remove(path)
+            return None
+        if not ok:
+            self._log(f"dropping snapshot {path}: it belongs to different inputs")
+            self._remove(path)
+            return None
+        rows, cols = self.shape
+        return np.unpackbits(packed, count=rows * cols).astype(bool).reshape(rows, cols)
+
+    def latest(self, max_generation=None, required=()):
+        """
+        Return (generation, grid) for the newest loadable snapshot at or below
+        `max_generation`, or (0, None) if there is none. Every generation in
+        `required` that is at or below the chosen one must also have a
+        loadable snapshot, so callers can still produce those checkpoints.
+        """
+        available = [g for g in self.generations() if max_generation is None or g <= max_generation]
+        have = set(available)
+        checked = set()
+
+        def usable(g):
+            if g not in checked:
+                if g not in have or self.load(g) is None:
+                    have.discard(g)
+                    return False
+                checked.add(g)
+            return True
+
+        for generation in reversed(available):
+            if not all(usable(r) for r in required if r < generation):
+                continue
+            grid = self.load(generation)
+            if grid is not None:
+                return generation, grid
+            have.discard(generation)
+        return 0, None
+
+    def resume(self, gol, max_generation=None, required=()):
+        """
+        Move `gol` (still at generation 0) to the latest usable snapshot; see
+        latest(). Returns the generation it now stands at.
+        """
+        generation, grid = self.latest(max_generation, required)
+        if grid is not None:
+            gol.grid = grid
+            gol.generation = generation
+            self._log(f"resumed from generation {generation}")
+        return generation
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
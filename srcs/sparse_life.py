@@ -0,0 +1,146 @@
+# File: srcs/sparse_life.py
+
+import hashlib
+import numpy as np
+from game_of_life import DIRECTIONS, RULE_TABLE, GameOfLifeWormhole
+
+def _is_live(live, cells):
+    """Vectorized membership test of flat indices against the sorted live set."""
+    if live.size == 0:
+        return np.zeros(cells.shape, dtype=bool)
+    pos = np.searchsorted(live, cells)
+    return live[np.minimum(pos, live.size - 1)] == cells
+
+def step_live(live, rows, cols, corrections):
+    """
+    Return the sorted flat indices of the cells alive one generation after
+    the sorted int64 flat indices `live`, on a rows x cols board with the
+    (cells, table) from GameOfLifeWormhole.compile_wormhole_corrections.
+    Plain cells are counted by scattering every live cell onto its 8 Moore
+    neighbors; the wormhole-affected cells (whose neighbors are not the
+    Moore stencil) are then counted directly by looking up their resolved
+    neighbors in the live set.
+    """
+    corr_cells, corr_table = corrections
+
+    # 1) Birth/survival candidates around live cells, with plain Moore counts.
+    #    x counts y in direction (dr, dc) iff y = x + (dr, dc), so scatter y → y - (dr, dc).
+    r, c = np.divmod(live, cols)
+    targets = []
+    for dr, dc in DIRECTIONS:
+        xr, xc = r - dr, c - dc
+        ok = (xr >= 0) & (xr < rows) & (xc >= 0) & (xc < cols)
+        targets.append(xr[ok] * cols + xc[ok])
+    candidates, counts = np.unique(np.concatenate(targets), return_counts=True)
+
+    # Cells with wormhole neighbors are handled separately
+    if corr_cells.size:
+        plain = ~np.isin(candidates, corr_cells, assume_unique=True)
+        candidates, counts = candidates[plain], counts[plain]
+    born_or_kept = RULE_TABLE[_is_live(live, candidates).view(np.uint8), counts]
+    new_plain = candidates[born_or_kept]
+
+    # 2) Wormhole-affected cells from their resolved neighbors
+    if corr_cells.size:
+        corr_counts = _is_live(live, corr_table).sum(axis=1)
+        keep = RULE_TABLE[_is_live(live, corr_cells).view(np.uint8), corr_counts]
+        return np.sort(np.concatenate((new_plain, corr_cells[keep])))
+    return new_plain
+
+class SparseGameOfLife(GameOfLifeWormhole):
+    """
+    Game of Life with wormholes that stores only the live cells, as a sorted
+    int64 array of flat indices r*cols + c. Memory and per-generation work
+    scale with the number of live cells (plus the wormhole-affected cells),
+    not with rows*cols, so huge mostly-empty boards are cheap.
+
+    Neighbors resolve through the same teleport() precedence as
+    GameOfLifeWormhole. `grid` is still available as a dense array (built on
+    demand, and assignable), so boards can be loaded and saved with
+    image_utils exactly as before; avoid touching it on boards too large
+    to densify. simulate() returns the dense grid like GameOfLifeWormhole's;
+    simulate_live() runs the same way but returns a copy of `live`. Cycle
+    detection hashes `live`, so simulate_live(..., detect_cycles=True) never
+    densifies. History recording, snapshots and workers > 1 work on dense
+    grids and do.
+    """
+
+    def __init__(self, grid, h_wormholes=None, v_wormholes=None, metrics=None):
+        """
+        grid:        2D boolean numpy array (True = alive, False = dead)
+        h_wormholes: dict mapping (r, c) → (r2, c2) for horizontal tunnels
+        v_wormholes: dict mapping (r, c) → (r2, c2) for vertical tunnels
+        metrics:     optional RunMetrics, as for GameOfLifeWormhole
+        """
+        super().__init__(grid, h_wormholes, v_wormholes, metrics=metrics)
+        self.engine = "sparse"
+
+    @classmethod
+    def from_live_cells(cls, shape, live, h_wormholes=None, v_wormholes=None, metrics=None):
+        """
+        Build a board of `shape` from flat live-cell indices without ever
+        allocating a dense rows x cols array.
+        """
+        board = cls(np.zeros((0, 0), dtype=bool), h_wormholes, v_wormholes, metrics=metrics)
+        board.rows, board.cols = shape
+        board.live = np.unique(np.asarray(live, dtype=np.int64))
+        return board
+
+    @property
+    def grid(self):
+        """The current generation as a dense (rows, cols) boolean array."""
+        dense = np.zeros(self.rows * self.cols, dtype=bool)
+        dense[self.live] = True
+        return dense.reshape(self.rows, self.cols)
+
+    @grid.setter
+    def grid(self, value):
+        self.rows, self.cols = value.shape
+        self.live = np.flatnonzero(value).astype(np.int64)
+
+    @property
+    def population(self):
+        """Number of live cells."""
+        return int(self.live.size)
+
+    def step(self):
+        """
+        Execute one generation; see step_live().
+        """
+        self.live = step_live(self.live, self.rows, self.cols, self.compile_wormhole_corrections())
+        self.generation += 1
+        self._steps_computed += 1
+
+    def state_digest(self):
+        """
+        Return a 16-byte digest of the current generation (shape + live indices).
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(np.asarray((self.rows, self.cols), dtype=np.int64).tobytes())
+        h.update(self.live.tobytes())
+        return h.digest()
+
+    def _save_state(self):
+        return self.live
+
+    def _restore_state(self, state):
+        self.live = state
+
+    def _state_array(self):
+        return self.live
+
+    def simulate_live(self, iterations, detect_cycles=False, workers=1, history=None, snapshots=None):
+        """
+        simulate(), but returns a copy of the sorted live-cell indices instead
+        of the dense grid, for boards too large to densify.
+        """
+        self._run(iterations, detect_cycles, workers, history, snapshots)
+        return self.live.copy()
+
+    def _simulate(self, iterations, detect_cycles, workers, history=None):
+        """simulate() for the sparse board, stepping `live` directly."""
+        if detect_cycles or workers > 1 or history is not None:
+            super()._simulate(iterations, detect_cycles, workers, history)
+            return
+        for _ in range(iterations):
+            self.step()
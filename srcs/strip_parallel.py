@@ -0,0 +1,106 @@
+# File: srcs/strip_parallel.py
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from game_of_life import RULE_TABLE, moore_counts
+
+def split_rows(rows, workers):
+    """
+    Split `rows` into `workers` contiguous [lo, hi) strips of near-equal height.
+    """
+    bounds = np.linspace(0, rows, workers + 1).round().astype(int)
+    return [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+def strip_references(rows, cols, corrections, strips):
+    """
+    Assign every wormhole-affected cell to the strip that owns it.
+    Returns one (cells, refs, cross) triple per strip, where
+      cells: (row, col) arrays of the affected cells in that strip
+      refs:  (n, 8) flat indices into the zero-bordered (rows+2, cols+2) board
+             of their resolved neighbors; out-of-bounds points at index 0
+      cross: how many of those references fall outside the strip and its
+             1-row halo, i.e. are read from another worker's strip
+    """
+    cells, table = corrections
+    sentinel = rows * cols
+    width = cols + 2
+    cr, cc = np.divmod(cells, cols)
+    nr, nc = np.divmod(table.astype(np.int64), cols)
+    refs = (nr + 1) * width + (nc + 1)
+    refs[table == sentinel] = 0
+
+    out = []
+    for lo, hi in strips:
+        mine = (cr >= lo) & (cr < hi)
+        ref_rows = nr[mine]
+        outside = (table[mine] != sentinel) & ((ref_rows < lo - 1) | (ref_rows > hi))
+        out.append(((cr[mine], cc[mine]), refs[mine], int(outside.sum())))
+    return out
+
+def _strip_worker(shm_name, shape, lo, hi, cells, refs, iterations, barrier):
+    """
+    Advance rows [lo, hi) for `iterations` generations. Both generations live in
+    one shared block of two zero-bordered boards; after each generation all
+    workers meet at the barrier, which makes the freshly written halo rows and
+    cross-strip wormhole targets visible before anyone reads them.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        boards = np.ndarray((2,) + shape, dtype=np.uint8, buffer=shm.buf)
+        cr, cc = cells
+        counts = np.empty((hi - lo, shape[1] - 2), dtype=np.uint8)
+        for gen in range(iterations):
+            cur, nxt = boards[gen % 2], boards[(gen + 1) % 2]
+            moore_counts(cur[lo:hi + 2], out=counts)
+            if len(cr):
+                counts[cr - lo, cc] = cur.ravel()[refs].sum(axis=1, dtype=np.uint8)
+            nxt[lo + 1:hi + 1, 1:-1] = RULE_TABLE[cur[lo + 1:hi + 1, 1:-1], counts]
+            barrier.wait()
+    except BaseException:
+        barrier.abort()
+        raise
+    finally:
+        del boards
+        shm.close()
+
+def simulate_strips(grid, corrections, iterations, workers):
+    """
+    Run `iterations` generations of `grid` split into horizontal strips, one
+    per worker process, with both generations held in shared memory.
+    `corrections` is GameOfLifeWormhole.compile_wormhole_corrections().
+    Returns the final grid; the result is identical to the serial engines.
+    """
+    rows, cols = grid.shape
+    strips = split_rows(rows, max(1, min(workers, rows)))
+    shape = (rows + 2, cols + 2)
+
+    shm = shared_memory.SharedMemory(create=True, size=2 * shape[0] * shape[1])
+    try:
+        boards = np.ndarray((2,) + shape, dtype=np.uint8, buffer=shm.buf)
+        boards[...] = 0
+        boards[0, 1:-1, 1:-1] = grid
+
+        ctx = mp.get_context()
+        barrier = ctx.Barrier(len(strips))
+        procs = []
+        for (lo, hi), (cells, refs, _) in zip(strips, strip_references(rows, cols, corrections, strips)):
+            proc = ctx.Process(
+                target=_strip_worker,
+                args=(shm.name, shape, lo, hi, cells, refs, iterations, barrier),
+            )
+            proc.start()
+            procs.append(proc)
+        for proc in procs:
+            proc.join()
+
+        failed = [proc.exitcode for proc in procs if proc.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"{len(failed)} strip worker(s) failed (exit codes {failed})")
+
+        result = boards[iterations % 2, 1:-1, 1:-1].astype(bool)
+        del boards
+        return result
+    finally:
+        shm.close()
+        shm.unlink()
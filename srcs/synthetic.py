@@ -0,0 +1,36 @@
+# File: srcs/synthetic.py
+
+import numpy as np
+
+def random_grid(rows, cols, density=0.3, seed=None):
+    """
+    Return a (rows, cols) boolean starting grid where each cell is alive with
+    probability `density`.
+    """
+    rng = np.random.default_rng(seed)
+    return rng.random((rows, cols)) < density
+
+def random_tunnel_map(rows, cols, portals, portal_size=1, seed=None):
+    """
+    Return an (rows, cols, 3) uint8 RGB tunnel map with `portals` wormholes,
+    each a pair of portal_size x portal_size squares in its own unique color.
+    Squares are placed on a lattice with a 1-pixel gap so no two ever touch,
+    which makes every pair valid for parse_wormholes_from_color_map.
+    """
+    pitch = portal_size + 1
+    slots_r, slots_c = rows // pitch, cols // pitch
+    if 2 * portals > slots_r * slots_c:
+        raise ValueError(
+            f"Cannot fit {portals} portal pairs of size {portal_size} on a {rows}x{cols} map"
+        )
+    if portals >= 1 << 24:
+        raise ValueError("At most 2**24 - 1 distinct portal colors are available")
+
+    rng = np.random.default_rng(seed)
+    slots = rng.choice(slots_r * slots_c, size=2 * portals, replace=False)
+    arr = np.zeros((rows, cols, 3), dtype=np.uint8)
+    for i, slot in enumerate(slots.tolist()):
+        color = (i // 2) + 1
+        r0, c0 = (slot // slots_c) * pitch, (slot % slots_c) * pitch
+        arr[r0:r0 + portal_size, c0:c0 + portal_size] = ((color >> 16) & 255, (color >> 8) & 255, color & 255)
+    return arr
@@ -0,0 +1,199 @@
+# File: srcs/temporal_tiling.py
+
+import numpy as np
+
+class _Scratch:
+    """Preallocated temporaries for life_step() on an (h, w) region."""
+
+    def __init__(self, h, w):
+        self.row_sums = np.empty((h + 2, w), dtype=np.uint8)
+        self.box = np.empty((h, w), dtype=np.uint8)
+        self.born = np.empty((h, w), dtype=bool)
+        self.kept = np.empty((h, w), dtype=bool)
+
+def life_step(padded, out, scratch):
+    """
+    One plain (wormhole-free) generation of the region inside the one-cell
+    border of the uint8 array `padded`, written into `out` (which may be
+    padded[1:-1, 1:-1] itself). Uses the 3x3 box sum including the cell:
+    a cell is alive next iff the sum is 3, or it is 4 and the cell is alive.
+    That is 4 additions instead of moore_counts()'s 8 and no RULE_TABLE
+    gather, and nothing is allocated.
+    """
+    rs, box = scratch.row_sums, scratch.box
+    np.add(padded[:, :-2], padded[:, 1:-1], out=rs)
+    rs += padded[:, 2:]
+    np.add(rs[:-2], rs[1:-1], out=box)
+    box += rs[2:]
+    np.equal(box, 3, out=scratch.born)
+    np.equal(box, 4, out=scratch.kept)
+    np.logical_and(scratch.kept, padded[1:-1, 1:-1], out=scratch.kept)
+    np.logical_or(scratch.born, scratch.kept, out=out)
+
+class TemporalTiler:
+    """
+    Advances a board `depth` generations per pass over memory instead of one.
+
+    The board is cut into tile_size x tile_size tiles. A tile whose
+    depth-wide halo contains no wormhole-affected cell is "clean": its halo
+    region is copied into a small zero-bordered buffer and stepped `depth`
+    times there while it stays in cache. Garbage from the cut-off border
+    creeps in one cell per generation, so after `depth` steps the tile
+    itself is still exact.
+
+    The other ("dirty") tiles can depend on far-away cells through
+    wormholes, so they are synchronised every generation: each is stepped
+    once from a full-board double buffer, then the wormhole-affected cells
+    are recomputed from their resolved neighbors. Whatever they read from
+    outside the dirty tiles (the one-cell ring around them and the wormhole
+    exits) lies in clean tiles, whose passes record those cells at every
+    intermediate generation. The result is exactly GameOfLifeWormhole.step()
+    applied `depth` times; the saving shrinks as wormholes dirty more tiles.
+    """
+
+    def __init__(self, rows, cols, corrections, tile_size=256, depth=8):
+        """
+        rows, cols:  board shape
+        corrections: (cells, table) from GameOfLifeWormhole.compile_wormhole_corrections
+        tile_size:   tile side in cells; a tile plus halos (and four
+                     temporaries of that size) should fit in L2
+        depth:       generations per pass, and the halo width
+        """
+        if tile_size <= 0 or depth <= 0:
+            raise ValueError("tile_size and depth must be positive")
+        self.rows, self.cols = rows, cols
+        self.tile_size = tile_size
+        self.depth = depth
+        self.tile_rows = -(-rows // tile_size)
+        self.tile_cols = -(-cols // tile_size)
+
+        cells, table = corrections
+        sentinel = rows * cols
+        self._corr_cells = cells
+        self._corr_targets = table
+        # Corrections as indices on the zero-bordered (rows+2, cols+2) buffers
+        r, c = np.divmod(table.astype(np.int64), cols)
+        self._corr_index = (r + 1) * (cols + 2) + (c + 1)
+        self._corr_index[table == sentinel] = 0
+        cr, cc = np.divmod(cells, cols)
+        self._corr_padded = (cr + 1) * (cols + 2) + (cc + 1)
+
+        self._plans = {}    # depth → _EpochPlan; a shorter final pass needs its own
+        self._scratch = {}  # region shape → _Scratch
+        self._work = None   # full-board double buffer for the dirty tiles
+
+    def _plan(self, depth):
+        if depth not in self._plans:
+            self._plans[depth] = _EpochPlan(self, depth)
+        return self._plans[depth]
+
+    def scratch(self, h, w):
+        if (h, w) not in self._scratch:
+            self._scratch[(h, w)] = _Scratch(h, w)
+        return self._scratch[(h, w)]
+
+    def advance(self, grid, generations):
+        """Return `grid` advanced `generations` generations, as a new boolean array."""
+        grid = np.array(grid, dtype=bool)
+        while generations > 0:
+            depth = min(self.depth, generations)
+            grid = self._plan(depth).run(grid)
+            generations -= depth
+        return grid
+
+class _EpochPlan:
+    """Tile classification and index lists for one pass of `depth` generations."""
+
+    def __init__(self, tiler, depth):
+        rows, cols, t = tiler.rows, tiler.cols, tiler.tile_size
+        self.tiler = tiler
+        self.depth = depth
+
+        # A tile is dirty if an affected cell lies within `depth` of it
+        dirty = np.zeros((tiler.tile_rows, tiler.tile_cols), dtype=bool)
+        for r, c in zip(*np.divmod(tiler._corr_cells, cols)):
+            dirty[max(r - depth, 0) // t:min(r + depth, rows - 1) // t + 1,
+                  max(c - depth, 0) // t:min(c + depth, cols - 1) // t + 1] = True
+
+        def bounds(tr, tc):
+            return tr * t, min((tr + 1) * t, rows), tc * t, min((tc + 1) * t, cols)
+
+        self.dirty_tiles = [bounds(tr, tc) for tr, tc in zip(*np.nonzero(dirty))]
+
+        # Cells the dirty tiles read from clean tiles: the ring around them and wormhole exits
+        mask = np.zeros((rows + 2, cols + 2), dtype=bool)
+        mask[1:-1, 1:-1] = np.repeat(np.repeat(dirty, t, axis=0), t, axis=1)[:rows, :cols]
+        ring = np.zeros_like(mask)
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                ring[1:-1, 1:-1] |= mask[1 + dr:rows + 1 + dr, 1 + dc:cols + 1 + dc]
+        ring &= ~mask
+        targets = tiler._corr_targets[tiler._corr_targets != rows * cols].astype(np.int64)
+        ring_cells = np.flatnonzero(ring[1:-1, 1:-1])
+        outside = targets[~mask[1:-1, 1:-1].ravel()[targets]]
+        self.needed = np.union1d(ring_cells, outside)
+        nr, nc = np.divmod(self.needed, cols)
+        self.needed_padded = (nr + 1) * (cols + 2) + (nc + 1)
+
+        # Clean tiles: destination bounds, halo bounds, and the needed cells they record
+        needed_tile = (nr // t) * tiler.tile_cols + nc // t
+        self.clean_tiles = []
+        for tr, tc in zip(*np.nonzero(~dirty)):
+            r0, r1, c0, c1 = bounds(tr, tc)
+            h0, h1 = max(r0 - depth, 0), min(r1 + depth, rows)
+            g0, g1 = max(c0 - depth, 0), min(c1 + depth, cols)
+            which = np.flatnonzero(needed_tile == tr * tiler.tile_cols + tc)
+            record = (nr[which] - h0 + 1) * (g1 - g0 + 2) + (nc[which] - g0 + 1)
+            self.clean_tiles.append((r0, r1, c0, c1, h0, h1, g0, g1, which, record))
+
+    def run(self, grid):
+        """Advance `grid` by self.depth generations; returns a new array."""
+        tiler, depth = self.tiler, self.depth
+        out = np.empty_like(grid)
+        traces = np.empty((depth, len(self.needed)), dtype=np.uint8)
+        traces[0] = grid.ravel()[self.needed]
+
+        buffers = {}
+        for r0, r1, c0, c1, h0, h1, g0, g1, which, record in self.clean_tiles:
+            shape = (h1 - h0 + 2, g1 - g0 + 2)
+            if shape not in buffers:
+                buffers[shape] = np.zeros(shape, dtype=np.uint8)
+            buf = buffers[shape]
+            inner = buf[1:-1, 1:-1]
+            inner[...] = grid[h0:h1, g0:g1]
+            scratch = tiler.scratch(*inner.shape)
+            for step in range(1, depth + 1):
+                life_step(buf, inner, scratch)
+                if step < depth and len(which):
+                    traces[step, which] = buf.ravel()[record]
+            out[r0:r1, c0:c1] = inner[r0 - h0:r1 - h0, c0 - g0:c1 - g0]
+
+        if self.dirty_tiles:
+            self._run_dirty(grid, out, traces)
+        return out
+
+    def _run_dirty(self, grid, out, traces):
+        """Step the dirty tiles one synchronised generation at a time."""
+        tiler, depth = self.tiler, self.depth
+        if tiler._work is None:
+            tiler._work = [np.zeros((tiler.rows + 2, tiler.cols + 2), dtype=np.uint8) for _ in range(2)]
+        cur, nxt = tiler._work
+        for r0, r1, c0, c1 in self.dirty_tiles:
+            cur[r0 + 1:r1 + 1, c0 + 1:c1 + 1] = grid[r0:r1, c0:c1]
+        cur_flat, nxt_flat = cur.ravel(), nxt.ravel()
+        cur_flat[self.needed_padded] = traces[0]
+
+        for step in range(depth):
+            for r0, r1, c0, c1 in self.dirty_tiles:
+                life_step(cur[r0:r1 + 2, c0:c1 + 2], nxt[r0 + 1:r1 + 1, c0 + 1:c1 + 1], tiler.scratch(r1 - r0, c1 - c0))
+            if len(tiler._corr_padded):
+                counts = cur_flat[tiler._corr_index].sum(axis=1, dtype=np.uint8)
+                alive = cur_flat[tiler._corr_padded]
+                nxt_flat[tiler._corr_padded] = (counts == 3) | ((counts == 2) & (alive == 1))
+            if step + 1 < depth:
+                nxt_flat[self.needed_padded] = traces[step + 1]
+            cur, nxt = nxt, cur
+            cur_flat, nxt_flat = nxt_flat, cur_flat
+
+        for r0, r1, c0, c1 in self.dirty_tiles:
+            out[r0:r1, c0:c1] = cur[r0 + 1:r1 + 1, c0 + 1:c1 + 1]
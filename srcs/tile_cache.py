@@ -0,0 +1,129 @@
+# File: srcs/tile_cache.py
+
+from collections import OrderedDict
+import numpy as np
+from game_of_life import RULE_TABLE, moore_counts
+
+class TileCache:
+    """
+    Bounded LRU map from a tile's contents plus its 1-cell halo to the tile's
+    next generation. Only valid for tiles whose cells all use the plain Moore
+    neighborhood, so the answer depends on nothing but the key.
+
+    A cache can be shared by several boards as long as they use the same
+    tile_size. The hits / misses / evictions counters are cumulative.
+    """
+
+    def __init__(self, tile_size=16, maxsize=65536):
+        if tile_size < 1 or maxsize < 1:
+            raise ValueError("tile_size and maxsize must both be positive")
+        self.tile_size = tile_size
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached tile for `key` (marking it recently used), or None."""
+        tile = self._entries.get(key)
+        if tile is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return tile
+
+    def put(self, key, tile):
+        """Store `tile` under `key`, evicting the least recently used entry if full."""
+        self._entries[key] = tile
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self):
+        """Return the counters as a dict, including the hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "tile_size": self.tile_size,
+            "maxsize": self.maxsize,
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+class TileMemoStepper:
+    """
+    Advances a board tile by tile. Tiles that contain no wormhole-affected
+    cell go through the TileCache; the others are computed directly with
+    moore_counts() and then patched from their resolved neighbors.
+    """
+
+    def __init__(self, rows, cols, corrections, cache):
+        """
+        rows, cols:  board shape
+        corrections: (cells, table) from GameOfLifeWormhole.compile_wormhole_corrections
+        cache:       TileCache to read from and fill
+        """
+        self.rows, self.cols = rows, cols
+        self.cache = cache
+        t = cache.tile_size
+        self.tile_rows = -(-rows // t)
+        self.tile_cols = -(-cols // t)
+
+        # Board padded up to whole tiles plus a 1-cell dead halo all around
+        self._padded = np.zeros((self.tile_rows * t + 2, self.tile_cols * t + 2), dtype=np.uint8)
+        self._next = np.zeros((self.tile_rows * t, self.tile_cols * t), dtype=bool)
+
+        cells, table = corrections
+        sentinel = rows * cols
+        width = self._padded.shape[1]
+        r, c = np.divmod(table.astype(np.int64), cols)
+        self._corr_index = (r + 1) * width + (c + 1)
+        self._corr_index[table == sentinel] = 0
+        self._corr_cells = np.divmod(cells, cols)
+
+        self.direct_tiles = set()
+        for cr, cc in zip(*self._corr_cells):
+            self.direct_tiles.add((int(cr) // t, int(cc) // t))
+
+    def step(self, grid):
+        """
+        Return the next generation of `grid` as a new (rows, cols) boolean array.
+        """
+        t = self.cache.tile_size
+        padded = self._padded
+        padded[1:self.rows + 1, 1:self.cols + 1] = grid
+        nxt = self._next
+
+        windows = np.lib.stride_tricks.sliding_window_view(padded, (t + 2, t + 2))[::t, ::t]
+        keys = np.packbits(windows.reshape(self.tile_rows * self.tile_cols, -1), axis=1)
+
+        for tr in range(self.tile_rows):
+            for tc in range(self.tile_cols):
+                region = windows[tr, tc]
+                out = nxt[tr * t:(tr + 1) * t, tc * t:(tc + 1) * t]
+                if (tr, tc) in self.direct_tiles:
+                    out[...] = RULE_TABLE[region[1:-1, 1:-1], moore_counts(region)]
+                    continue
+
+                key = keys[tr * self.tile_cols + tc].tobytes()
+                tile = self.cache.get(key)
+                if tile is None:
+                    tile = RULE_TABLE[region[1:-1, 1:-1], moore_counts(region)]
+                    tile.flags.writeable = False
+                    self.cache.put(key, tile)
+                out[...] = tile
+
+        if len(self._corr_index):
+            cr, cc = self._corr_cells
+            counts = padded.ravel()[self._corr_index].sum(axis=1, dtype=np.uint8)
+            nxt[cr, cc] = RULE_TABLE[padded[cr + 1, cc + 1], counts]
+
+        return nxt[:self.rows, :self.cols].copy()
@@ -0,0 +1,187 @@
+# File: srcs/topology_cache.py
+
+import hashlib
+import os
+import tempfile
+import zipfile
+import numpy as np
+from image_utils import load_color_image
+from wormhole_parser import PARSER_VERSION, parse_wormholes_from_color_map
+from game_of_life import GameOfLifeWormhole
+from metrics import timed
+
+def _dict_to_arrays(holes):
+    """Split a portal map into (n, 2) int32 key and value arrays, keeping order."""
+    keys = np.array(list(holes.keys()), dtype=np.int32).reshape(-1, 2)
+    values = np.array(list(holes.values()), dtype=np.int32).reshape(-1, 2)
+    return keys, values
+
+def _arrays_to_dict(keys, values):
+    """Inverse of _dict_to_arrays: rebuild the (r, c) → (r2, c2) map with Python ints."""
+    return dict(zip(map(tuple, keys.tolist()), map(tuple, values.tolist())))
+
+class TopologyCache:
+    """
+    Content-addressed on-disk cache of compiled wormhole topologies.
+
+    Each entry is one .npz file holding the parsed h_wormholes / v_wormholes
+    maps, the resolved (rows*cols, 8) neighbor table and the wormhole
+    corrections (cells, table) the other engines use. It is named by a
+    SHA-256 of the two tunnel files' bytes, the board shape and
+    PARSER_VERSION, so changing either image or the parser yields a new key.
+    Entries are written to a temp file and renamed into place, hits refresh
+    the entry's mtime, and the least recently used entries are deleted once
+    the directory exceeds max_bytes.
+    """
+
+    def __init__(self, cache_dir, max_bytes=1 << 30, verbose=True):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.verbose = verbose
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _log(self, message):
+        if self.verbose:
+            print(f"[topology cache] {message}")
+
+    def key_for(self, h_tunnel_path, v_tunnel_path, shape):
+        """Return the hex cache key for a tunnel image pair and board shape."""
+        digest = hashlib.sha256()
+        digest.update(f"parser-v{PARSER_VERSION};shape={shape[0]}x{shape[1]};".encode())
+        for path in (h_tunnel_path, v_tunnel_path):
+            with open(path, "rb") as f:
+                data = f.read()
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npz")
+
+    def load(self, key):
+        """
+        Return (h_wormholes, v_wormholes, neighbor_table, corrections) for `key`,
+        or None on a miss. Unreadable entries (including ones written before
+        corrections were cached) are deleted and count as misses.
+        """
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                h = _arrays_to_dict(data["h_keys"], data["h_values"])
+                v = _arrays_to_dict(data["v_keys"], data["v_values"])
+                table = data["neighbor_table"]
+                corrections = (data["correction_cells"], data["correction_table"])
+        except FileNotFoundError:
+            self.misses += 1
+            self._log(f"miss {key[:12]}")
+            return None
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as err:
+            self.misses += 1
+            self._log(f"miss {key[:12]} (dropping unreadable entry: {err})")
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass  # evicted by another process since np.load; the data is already read
+        self.hits += 1
+        self._log(f"hit {key[:12]}")
+        return h, v, table, corrections
+
+    def store(self, key, h_wormholes, v_wormholes, neighbor_table, corrections):
+        """
+        Atomically write an entry, then evict old entries if over budget. An
+        entry larger than max_bytes on its own is not kept.
+        """
+        h_keys, h_values = _dict_to_arrays(h_wormholes)
+        v_keys, v_values = _dict_to_arrays(v_wormholes)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    h_keys=h_keys, h_values=h_values,
+                    v_keys=v_keys, v_values=v_values,
+                    neighbor_table=neighbor_table,
+                    correction_cells=corrections[0], correction_table=corrections[1],
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            size = os.path.getsize(tmp_path)
+            if size > self.max_bytes:
+                self._remove(tmp_path)
+                self._log(f"not storing {key[:12]}: {size} bytes exceeds max_bytes={self.max_bytes}")
+                return
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self._log(f"stored {key[:12]}")
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".npz"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            self._log(f"evicted {os.path.basename(path)[:12]}")
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def load_topology(h_tunnel_path, v_tunnel_path, shape, cache=None, metrics=None):
+    """
+    Return (h_wormholes, v_wormholes, neighbor_table, corrections) for a tunnel
+    image pair on a board of `shape`, ready to pass to GameOfLifeWormhole.
+    With a TopologyCache, a warm entry skips decoding, parsing and compiling
+    entirely; on a miss the images are parsed, the table and corrections
+    compiled, and the result stored. Without a cache, neighbor_table and
+    corrections are None and the simulator compiles what its engine needs
+    lazily as before.
+    Phase times go to `metrics` (a RunMetrics) when given.
+    """
+    key = None
+    if cache is not None:
+        with timed(metrics, "topology_cache"):
+            key = cache.key_for(h_tunnel_path, v_tunnel_path, shape)
+            cached = cache.load(key)
+        if cached is not None:
+            return cached
+
+    with timed(metrics, "decode_tunnels"):
+        h_arr = load_color_image(h_tunnel_path)
+        v_arr = load_color_image(v_tunnel_path)
+    with timed(metrics, "parse"):
+        h_wormholes = parse_wormholes_from_color_map(h_arr)
+        v_wormholes = parse_wormholes_from_color_map(v_arr)
+    if cache is None:
+        return h_wormholes, v_wormholes, None, None
+
+    with timed(metrics, "compile"):
+        topology = GameOfLifeWormhole(np.zeros(shape, dtype=bool), h_wormholes, v_wormholes)
+        table = topology.compile_neighbor_table()
+        corrections = topology.compile_wormhole_corrections()  # cached by the table build
+    with timed(metrics, "topology_cache"):
+        cache.store(key, h_wormholes, v_wormholes, table, corrections)
+    return h_wormholes, v_wormholes, table, corrections
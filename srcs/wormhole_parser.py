@@ -3,6 +3,9 @@
 import numpy as np
 from collections import deque
 
+# Bump when parsing semantics change, so cached topologies are invalidated
+PARSER_VERSION = 2
+
 def parse_wormholes_from_color_map(arr):
     """
     Given an (H, W, 3) RGB array `arr`, identify all non-black pixels by color.
@@ -16,6 +19,129 @@ def parse_wormholes_from_color_map(arr):
 
     Returns:
       A dict mapping (r, c) → (r', c') for every valid portal pixel.
+
+    Array-based implementation: RGB is packed into one uint32 key per pixel,
+    components are labeled with a vectorized union-find over same-key
+    neighbor pairs, and the pairing is built from sorted index arrays.
+    Produces exactly the same map and warnings as _parse_wormholes_bfs.
+    """
+    h, w, _ = arr.shape
+    key = (
+        (arr[..., 0].astype(np.uint32) << 16)
+        | (arr[..., 1].astype(np.uint32) << 8)
+        | arr[..., 2].astype(np.uint32)
+    )
+    flat_key = key.ravel()
+
+    # 1) Non-black pixels in raster (= lexicographic) order
+    pixels = np.flatnonzero(flat_key)
+    if pixels.size == 0:
+        return {}
+    position = np.full(h * w, -1, dtype=np.int64)
+    position[pixels] = np.arange(pixels.size)
+
+    # 2) Same-color 8-neighbor pairs; the 4 "forward" offsets cover every pair once
+    edges_u, edges_v = [], []
+    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        c0, c1 = max(0, -dc), w - max(0, dc)
+        src = key[:h - dr, c0:c1]
+        dst = key[dr:, c0 + dc:c1 + dc]
+        rr, cc = np.nonzero((src == dst) & (src != 0))
+        cc = cc + c0
+        edges_u.append(position[rr * w + cc])
+        edges_v.append(position[(rr + dr) * w + (cc + dc)])
+    root = _label_components(pixels.size, np.concatenate(edges_u), np.concatenate(edges_v))
+
+    # 3) Components: root is the component's first pixel, which is also the
+    #    pixel the BFS version starts from and sorts components by.
+    comp_roots, comp_sizes = np.unique(root, return_counts=True)
+    comp_keys = flat_key[pixels[comp_roots]]
+
+    # Colors in order of first appearance (dict order of the BFS version)
+    color_keys, color_first = np.unique(comp_keys, return_index=True)
+    color_rank = np.empty(color_keys.size, dtype=np.int64)
+    color_rank[np.argsort(color_first)] = np.arange(color_keys.size)
+    comp_rank = color_rank[np.searchsorted(color_keys, comp_keys)]
+
+    comp_order = np.lexsort((comp_roots, comp_rank))
+    comp_roots, comp_sizes, comp_rank = comp_roots[comp_order], comp_sizes[comp_order], comp_rank[comp_order]
+
+    # Pixels grouped by component in that same order; each component keeps raster order
+    comp_index = np.empty(pixels.size, dtype=np.int64)
+    comp_index[comp_roots] = np.arange(comp_roots.size)
+    pixel_order = np.lexsort((np.arange(pixels.size), comp_index[root]))
+    comp_start = np.concatenate(([0], np.cumsum(comp_sizes)[:-1]))
+
+    # 4) Validate each color: even component count, and equal sizes within each pair
+    group_start = np.flatnonzero(np.diff(comp_rank, prepend=-1))
+    group_count = np.diff(np.append(group_start, comp_rank.size))
+    comp_group = np.repeat(np.arange(group_start.size), group_count)
+    local = np.arange(comp_rank.size) - group_start[comp_group]
+    first = (local % 2 == 0) & (group_count[comp_group] % 2 == 0)
+    pair_first = np.flatnonzero(first)
+    pair_ok = comp_sizes[pair_first] == comp_sizes[np.minimum(pair_first + 1, comp_sizes.size - 1)]
+
+    group_ok = group_count % 2 == 0
+    group_ok[comp_group[pair_first[~pair_ok]]] = False
+
+    for g in np.flatnonzero(~group_ok).tolist():
+        start, ncomps = int(group_start[g]), int(group_count[g])
+        r0, c0 = divmod(int(pixels[comp_roots[start]]), w)
+        color = tuple(arr[r0, c0])
+        if ncomps % 2 != 0:
+            print(f"WARNING: Color {color} has {ncomps} connected components (odd). Skipping this color.")
+            continue
+        sizes = comp_sizes[start:start + ncomps]
+        i = start + 2 * int(np.flatnonzero(sizes[0::2] != sizes[1::2])[0])
+        print(
+            f"WARNING: Color {color} has components of different sizes "
+            f"{comp_sizes[i]} and {comp_sizes[i + 1]}. Skipping this color."
+        )
+
+    pair_a = pair_first[group_ok[comp_group[pair_first]]]
+    if pair_a.size == 0:
+        return {}
+    pair_b = pair_a + 1
+
+    # 5) Link the idx-th pixel of compA with the idx-th pixel of compB
+    lengths = comp_sizes[pair_a]
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    side_a = pixels[pixel_order[np.repeat(comp_start[pair_a], lengths) + offsets]]
+    side_b = pixels[pixel_order[np.repeat(comp_start[pair_b], lengths) + offsets]]
+
+    # Same insertion order as the BFS version: A → B, then B → A, pixel by pixel
+    keys = np.stack((side_a, side_b), axis=1).ravel()
+    values = np.stack((side_b, side_a), axis=1).ravel()
+    kr, kc = np.divmod(keys, w)
+    vr, vc = np.divmod(values, w)
+    return dict(zip(zip(kr.tolist(), kc.tolist()), zip(vr.tolist(), vc.tolist())))
+
+def _label_components(n, u, v):
+    """
+    Union-find over `n` nodes joined by edges (u[i], v[i]), fully vectorized:
+    repeatedly hook the larger root of every unsettled edge onto the smaller
+    one, then compress paths by pointer jumping. Returns, for every node, the
+    smallest node index in its component.
+    """
+    parent = np.arange(n, dtype=np.int64)
+    while u.size:
+        pu, pv = parent[u], parent[v]
+        live = pu != pv
+        if not live.any():
+            break
+        u, v, pu, pv = u[live], v[live], pu[live], pv[live]
+        np.minimum.at(parent, np.maximum(pu, pv), np.minimum(pu, pv))
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+    return parent
+
+def _parse_wormholes_bfs(arr):
+    """
+    Original per-pixel BFS implementation of parse_wormholes_from_color_map.
+    Much slower; kept as the reference the array-based parser is tested against.
     """
     h, w, _ = arr.shape
     visited = np.zeros((h, w), dtype=bool)
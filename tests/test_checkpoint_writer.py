@@ -0,0 +1,57 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from image_utils import load_binary_image_to_array
+from checkpoint_writer import CheckpointWriter, parse_checkpoints
+
+
+@pytest.mark.parametrize("spec,expected", [
+    ([1, 10, 100, 1000], [1, 10, 100, 1000]),
+    ("1,10,100,1000", [1, 10, 100, 1000]),
+    ("every:50:200", [50, 100, 150, 200]),
+    ("1,every:250:1000,500", [1, 250, 500, 750, 1000]),
+    ((5, 3, 3), [3, 5]),
+])
+def test_parse_checkpoints(spec, expected):
+    assert parse_checkpoints(spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["", "0,10", "every:0:10", "every:5", [-1]])
+def test_parse_checkpoints_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        parse_checkpoints(spec)
+
+
+def test_writer_snapshots_grid_before_returning(tmp_path):
+    grid = np.zeros((8, 9), dtype=bool)
+    with CheckpointWriter(max_pending=2) as writer:
+        for i in range(5):
+            grid[i, i] = True
+            writer.submit(grid, str(tmp_path / f"{i}.png"))
+    for i in range(5):
+        expected = np.zeros((8, 9), dtype=bool)
+        expected[np.arange(i + 1), np.arange(i + 1)] = True
+        assert np.array_equal(load_binary_image_to_array(str(tmp_path / f"{i}.png")), expected)
+
+
+def test_writer_close_returns_paths_in_submission_order(tmp_path):
+    writer = CheckpointWriter(workers=4)
+    paths = [str(tmp_path / f"{i}.png") for i in range(12)]
+    for i, path in enumerate(paths):
+        writer.submit(np.full((64 * (12 - i), 64), i % 2 == 0), path)
+    assert writer.close() == paths
+    assert writer.close() == []
+    with pytest.raises(RuntimeError):
+        writer.submit(np.zeros((2, 2), dtype=bool), str(tmp_path / "late.png"))
+
+
+def test_writer_reraises_write_errors(tmp_path):
+    writer = CheckpointWriter()
+    writer.submit(np.zeros((2, 2), dtype=bool), str(tmp_path / "missing-dir" / "x.png"))
+    with pytest.raises(OSError):
+        writer.close()
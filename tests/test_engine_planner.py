@@ -0,0 +1,71 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from engine_planner import choose_engine, estimate_costs
+from game_of_life import GameOfLifeWormhole
+from test_engines import load_case, random_case
+
+
+def test_choose_engine_by_density_size_and_portals():
+    assert choose_engine((4096, 4096), 100, 0)[0] == "sparse"
+    assert choose_engine((4096, 4096), 4096 * 4096 // 3, 0)[0] == "bitboard"
+    # data/problem-3: 71% of the cells are wormhole-corrected
+    assert choose_engine((192, 379), 1661, 0, changed_cells=5000)[0] == "bitboard"
+    assert choose_engine((192, 379), 1661, 51987, changed_cells=5000)[0] == "stencil"
+    assert choose_engine((192, 379), 475, 51987, changed_cells=79)[0] == "frontier"
+
+
+def test_per_step_runs_charge_the_grid_conversions():
+    whole = estimate_costs((512, 512), 5000, 0)
+    per_step = estimate_costs((512, 512), 5000, 0, per_step=True)
+    assert per_step["bitboard"] > whole["bitboard"] and per_step["sparse"] > whole["sparse"]
+    assert per_step["stencil"] == whole["stencil"]
+
+
+@pytest.mark.parametrize("case_name", ["example-0", "example-2", "problem-4"])
+def test_auto_engine_matches_table_on_data(case_name):
+    grid, h, v = load_case(case_name)
+    expected = GameOfLifeWormhole(grid, h, v).simulate(80)
+    gol = GameOfLifeWormhole(grid, h, v, engine="auto")
+    assert gol.engine in ("sparse", "stencil", "bitboard", "frontier")
+    assert np.array_equal(gol.simulate(80), expected)
+
+
+def test_planner_switches_to_sparse_as_board_dies_down(capsys):
+    grid = np.zeros((1024, 1024), dtype=bool)
+    # A 0.08% soup that burns out to ~300 cells of still lifes and blinkers
+    grid[492:532, 492:532] = np.random.default_rng(1).random((40, 40)) < 0.5
+    _, h, v = random_case(3, rows=1024, cols=1024, npairs=2)
+    expected = GameOfLifeWormhole(grid, h, v, engine="bitboard").simulate(300)
+
+    gol = GameOfLifeWormhole(grid, h, v, engine="auto")
+    assert gol.engine == "bitboard"
+    assert np.array_equal(gol.simulate(300), expected)
+    assert gol.engine == "sparse"
+    assert [engine for _, engine, _ in gol.planner.decisions] == ["bitboard", "sparse"]
+    assert "[engine planner]" in capsys.readouterr().out
+
+
+def test_planner_keeps_bitboard_off_wormhole_dense_boards():
+    grid, h, v = load_case("problem-3")
+    expected = GameOfLifeWormhole(grid, h, v).simulate(100, detect_cycles=True)
+
+    gol = GameOfLifeWormhole(grid, h, v, engine="auto")
+    assert gol.engine == "stencil"
+    assert np.array_equal(gol.simulate(100, detect_cycles=True), expected)
+    # Once the board settles, only a few dozen cells change per generation
+    assert [engine for _, engine, _ in gol.planner.decisions] == ["stencil", "frontier"]
+    assert gol.planner.decisions[-1][2].endswith("per-step")
+
+
+def test_forced_engine_has_no_planner():
+    grid, h, v = random_case(4)
+    gol = GameOfLifeWormhole(grid, h, v, engine="stencil")
+    assert gol.planner is None and gol.engine == "stencil"
+    with pytest.raises(ValueError):
+        GameOfLifeWormhole(grid, h, v, engine="fastest")
@@ -0,0 +1,379 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from image_utils import load_binary_image_to_array, load_color_image, save_array_to_image
+from wormhole_parser import parse_wormholes_from_color_map
+from game_of_life import GameOfLifeWormhole
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+
+
+def random_wormholes(rng, rows, cols, npairs):
+    """Build a symmetric portal map with `npairs` random single-pixel pairs."""
+    cells = rng.choice(rows * cols, size=2 * npairs, replace=False)
+    holes = {}
+    for a, b in zip(cells[0::2], cells[1::2]):
+        pa = (int(a) // cols, int(a) % cols)
+        pb = (int(b) // cols, int(b) % cols)
+        holes[pa] = pb
+        holes[pb] = pa
+    return holes
+
+
+def random_case(seed, rows=24, cols=31, density=0.35, npairs=12):
+    rng = np.random.default_rng(seed)
+    grid = rng.random((rows, cols)) < density
+    h = random_wormholes(rng, rows, cols, npairs)
+    v = random_wormholes(rng, rows, cols, npairs)
+    return grid, h, v
+
+
+def load_case(case_name):
+    case_dir = os.path.join(DATA_DIR, case_name)
+    grid = load_binary_image_to_array(os.path.join(case_dir, "starting_position.png"))
+    h = parse_wormholes_from_color_map(load_color_image(os.path.join(case_dir, "horizontal_tunnel.png")))
+    v = parse_wormholes_from_color_map(load_color_image(os.path.join(case_dir, "vertical_tunnel.png")))
+    return grid, h, v
+
+
+def assert_engine_matches_reference(engine, grid, h, v, steps):
+    ref = GameOfLifeWormhole(grid, h, v, engine="reference")
+    gol = GameOfLifeWormhole(grid, h, v, engine=engine)
+    for i in range(steps):
+        ref.step()
+        gol.step()
+        assert np.array_equal(ref.grid, gol.grid), f"{engine} diverged at generation {i + 1}"
+
+
+def test_neighbor_table_matches_get_neighbor_positions():
+    grid, h, v = random_case(0)
+    gol = GameOfLifeWormhole(grid, h, v)
+    table = gol.compile_neighbor_table()
+    sentinel = gol.rows * gol.cols
+    assert table.shape == (gol.rows * gol.cols, 8)
+    assert table.dtype == np.int32
+    for r in range(gol.rows):
+        for c in range(gol.cols):
+            row = table[r * gol.cols + c]
+            got = [(int(i) // gol.cols, int(i) % gol.cols) for i in row if i != sentinel]
+            assert got == gol.get_neighbor_positions(r, c)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_table_engine_matches_reference_random(seed):
+    grid, h, v = random_case(seed)
+    assert_engine_matches_reference("table", grid, h, v, steps=15)
+
+
+@pytest.mark.parametrize("case_name", ["example-0", "example-2", "problem-4"])
+def test_table_engine_matches_reference_on_data(case_name):
+    grid, h, v = load_case(case_name)
+    assert_engine_matches_reference("table", grid, h, v, steps=5)
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        GameOfLifeWormhole(np.zeros((3, 3), dtype=bool), engine="nope")
+
+
+@pytest.mark.parametrize("seed", [4, 5])
+def test_stencil_engine_matches_reference_random(seed):
+    grid, h, v = random_case(seed)
+    assert_engine_matches_reference("stencil", grid, h, v, steps=15)
+
+
+@pytest.mark.parametrize("case_name", ["example-0", "example-2", "problem-4"])
+def test_stencil_engine_matches_reference_on_data(case_name):
+    grid, h, v = load_case(case_name)
+    assert_engine_matches_reference("stencil", grid, h, v, steps=5)
+
+
+def test_corrections_cover_only_wormhole_cells():
+    grid, h, v = random_case(6, npairs=3)
+    gol = GameOfLifeWormhole(grid, h, v)
+    cells, _ = gol.compile_wormhole_corrections()
+    assert 0 < len(cells) <= 9 * (len(h) + len(v))
+
+
+def test_index_dtype_widens_past_int32():
+    from game_of_life import index_dtype
+    assert index_dtype(1000 * 1000) == np.int32
+    assert index_dtype(np.iinfo(np.int32).max) == np.int32
+    assert index_dtype(50_000 * 50_000) == np.int64
+    grid, h, v = random_case(7, npairs=3)
+    gol = GameOfLifeWormhole(grid, h, v)
+    assert gol.compile_neighbor_table().dtype == gol.compile_wormhole_corrections()[1].dtype == np.int32
+
+
+@pytest.mark.parametrize("shape", [(5, 64), (9, 70), (17, 130), (3, 1)])
+def test_bitboard_pack_roundtrip(shape):
+    from bitboard import pack_grid, unpack_grid
+    grid = np.random.default_rng(7).random(shape) < 0.5
+    words = pack_grid(grid)
+    assert words.dtype == np.uint64
+    assert words.shape == (shape[0], -(-shape[1] // 64))
+    assert np.array_equal(unpack_grid(words, shape[1]), grid)
+
+
+@pytest.mark.parametrize("seed,cols", [(8, 31), (9, 64), (10, 150)])
+def test_bitboard_engine_matches_reference_random(seed, cols):
+    grid, h, v = random_case(seed, cols=cols)
+    assert_engine_matches_reference("bitboard", grid, h, v, steps=12)
+
+
+def test_bitboard_simulate_matches_table_on_data():
+    grid, h, v = load_case("example-2")
+    expected = GameOfLifeWormhole(grid, h, v).simulate(40)
+    assert np.array_equal(GameOfLifeWormhole(grid, h, v, engine="bitboard").simulate(40), expected)
+
+
+def test_bitboard_engine_reuses_board_and_resyncs_after_grid_assignment():
+    grid, h, v = random_case(14, rows=40, cols=90)
+    gol = GameOfLifeWormhole(grid, h, v, engine="bitboard")
+    gol.step()
+    board = gol._bitboard
+    gol.simulate(3)
+    assert gol._bitboard is board
+    gol.grid = grid.copy()
+    gol.simulate(30)
+    assert np.array_equal(gol.grid, GameOfLifeWormhole(grid, h, v).simulate(30))
+
+
+def test_bitboard_blocks_match_single_block(monkeypatch):
+    import bitboard
+    grid, h, v = random_case(19, rows=45, cols=130)
+    corrections = GameOfLifeWormhole(grid, h, v).compile_wormhole_corrections()
+    expected = bitboard.BitboardLife(grid, corrections).simulate(10)
+    monkeypatch.setattr(bitboard, "BLOCK_WORDS", 3 * 7)  # 7 rows of 3 words: a ragged last block
+    board = bitboard.BitboardLife(grid, corrections)
+    assert board._block_rows == 7
+    assert np.array_equal(board.simulate(10), expected)
+
+
+@pytest.mark.parametrize("case_name", ["example-1", "example-2", "problem-4"])
+def test_cycle_detection_matches_plain_simulation(case_name):
+    grid, h, v = load_case(case_name)
+    plain = GameOfLifeWormhole(grid, h, v)
+    fast = GameOfLifeWormhole(grid, h, v)
+    prev = 0
+    for cp in [1, 10, 100, 300]:
+        expected = plain.simulate(cp - prev)
+        assert np.array_equal(fast.simulate(cp - prev, detect_cycles=True), expected), f"mismatch at {cp}"
+        assert fast.generation == cp
+        prev = cp
+
+
+def test_cycle_detection_blinker_fast_forwards():
+    grid = np.zeros((5, 5), dtype=bool)
+    grid[2, 1:4] = True
+    gol = GameOfLifeWormhole(grid)
+    assert np.array_equal(gol.simulate(1001, detect_cycles=True), grid.T)
+    stats = gol.cycle_stats
+    assert stats["detected"] and stats["start"] == 0 and stats["period"] == 2
+    assert stats["steps_computed"] < 5
+
+
+def test_cycle_detection_never_steps_past_the_target():
+    # A row of ten cells becomes a pentadecathlon (period 15)
+    grid = np.zeros((20, 20), dtype=bool)
+    grid[10, 5:15] = True
+    for n in (18, 70):  # the repeat is seen at generation 17
+        one_call = GameOfLifeWormhole(grid)
+        assert np.array_equal(one_call.simulate(n, detect_cycles=True), GameOfLifeWormhole(grid).simulate(n))
+        assert one_call.cycle_stats["period"] == 15
+        assert one_call.cycle_stats["steps_computed"] <= n
+
+    plain, chunked = GameOfLifeWormhole(grid), GameOfLifeWormhole(grid)
+    for n in (1, 9, 40, 3, 50, 7, 900):
+        expected = plain.simulate(n)
+        assert np.array_equal(chunked.simulate(n, detect_cycles=True), expected)
+        assert chunked.cycle_stats["steps_computed"] <= chunked.generation
+
+
+@pytest.mark.parametrize("engine", ["table", "frontier"])
+def test_cycle_history_dropped_after_grid_assignment(engine):
+    blinker = np.zeros((6, 6), dtype=bool)
+    blinker[2, 1:4] = True
+    block = np.zeros((6, 6), dtype=bool)
+    block[2:4, 2:4] = True
+    gol = GameOfLifeWormhole(blinker, engine=engine)
+    gol.simulate(5, detect_cycles=True)
+    assert gol.cycle_stats["period"] == 2
+    gol.grid = block.copy()
+    assert np.array_equal(gol.simulate(3, detect_cycles=True), block)
+    assert gol.cycle_stats["period"] == 1
+
+
+@pytest.mark.parametrize("seed", [11, 12])
+def test_frontier_engine_matches_reference_random(seed):
+    grid, h, v = random_case(seed)
+    assert_engine_matches_reference("frontier", grid, h, v, steps=20)
+
+
+@pytest.mark.parametrize("case_name", ["example-0", "example-2", "problem-4"])
+def test_frontier_engine_matches_reference_on_data(case_name):
+    grid, h, v = load_case(case_name)
+    assert_engine_matches_reference("frontier", grid, h, v, steps=5)
+
+
+def test_frontier_engine_resyncs_after_grid_assignment():
+    grid, h, v = random_case(13)
+    gol = GameOfLifeWormhole(grid, h, v, engine="frontier")
+    gol.simulate(3)
+    gol.grid = grid.copy()
+    gol.simulate(30)
+    assert np.array_equal(gol.grid, GameOfLifeWormhole(grid, h, v).simulate(30))
+
+
+def test_reverse_neighbors_invert_table():
+    grid, h, v = random_case(14, rows=8, cols=9)
+    gol = GameOfLifeWormhole(grid, h, v)
+    table = gol.compile_neighbor_table()
+    indptr, indices = gol.compile_reverse_neighbors()
+    for j in range(gol.rows * gol.cols):
+        expected = sorted(i for i in range(len(table)) for k in range(8) if table[i, k] == j)
+        assert sorted(indices[indptr[j]:indptr[j + 1]].tolist()) == expected
+
+
+@pytest.mark.parametrize("seed,tile_size", [(15, 4), (16, 7), (17, 32)])
+def test_memo_engine_matches_reference_random(seed, tile_size):
+    from tile_cache import TileCache
+    grid, h, v = random_case(seed)
+    ref = GameOfLifeWormhole(grid, h, v, engine="reference")
+    gol = GameOfLifeWormhole(grid, h, v, engine="memo", tile_cache=TileCache(tile_size=tile_size))
+    for _ in range(12):
+        ref.step()
+        gol.step()
+        assert np.array_equal(ref.grid, gol.grid)
+
+
+def test_memo_engine_matches_table_on_data():
+    grid, h, v = load_case("problem-2")
+    expected = GameOfLifeWormhole(grid, h, v).simulate(20)
+    gol = GameOfLifeWormhole(grid, h, v, engine="memo")
+    assert np.array_equal(gol.simulate(20), expected)
+    stats = gol.tile_cache.stats()
+    assert stats["hits"] > 0 and stats["misses"] > 0
+
+
+def test_tile_cache_lru_eviction():
+    from tile_cache import TileCache
+    cache = TileCache(tile_size=2, maxsize=2)
+    cache.put(b"a", 1)
+    cache.put(b"b", 2)
+    assert cache.get(b"a") == 1
+    cache.put(b"c", 3)
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == 1 and cache.get(b"c") == 3
+    assert cache.stats()["evictions"] == 1
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_strip_workers_match_serial(workers):
+    grid, h, v = random_case(18, rows=40, npairs=20)
+    expected = GameOfLifeWormhole(grid, h, v).simulate(25)
+    gol = GameOfLifeWormhole(grid, h, v)
+    assert np.array_equal(gol.simulate(25, workers=workers), expected)
+    assert gol.generation == 25
+
+
+def test_strip_references_count_cross_strip_links():
+    from strip_parallel import split_rows, strip_references
+    grid = np.zeros((20, 10), dtype=bool)
+    gol = GameOfLifeWormhole(grid, {(2, 5): (17, 5), (17, 5): (2, 5)})
+    strips = split_rows(20, 2)
+    assert strips == [(0, 10), (10, 20)]
+    refs = strip_references(20, 10, gol.compile_wormhole_corrections(), strips)
+    assert refs[0][2] > 0 and refs[1][2] > 0
+
+
+@pytest.mark.parametrize("seed,density", [(22, 0.35), (23, 0.05)])
+def test_sparse_engine_matches_reference_random(seed, density):
+    from sparse_life import SparseGameOfLife
+    grid, h, v = random_case(seed, density=density)
+    ref = GameOfLifeWormhole(grid, h, v, engine="reference")
+    sparse = SparseGameOfLife(grid, h, v)
+    for i in range(15):
+        ref.step()
+        sparse.step()
+        assert np.array_equal(ref.grid, sparse.grid), f"sparse diverged at generation {i + 1}"
+    assert sparse.population == int(ref.grid.sum())
+
+
+def test_sparse_engine_matches_table_on_data():
+    from sparse_life import SparseGameOfLife
+    grid, h, v = load_case("example-3")
+    expected = GameOfLifeWormhole(grid, h, v).simulate(30, detect_cycles=True)
+    sparse = SparseGameOfLife(grid, h, v)
+    assert np.array_equal(sparse.simulate(30), expected)
+    assert np.array_equal(sparse.simulate_live(5), np.flatnonzero(GameOfLifeWormhole(expected, h, v).simulate(5)))
+
+    cycling = SparseGameOfLife(grid, h, v)
+    cycling.simulate(30, detect_cycles=True)
+    assert np.array_equal(cycling.grid, expected)
+
+
+def test_sparse_simulate_result_round_trips_through_png(tmp_path):
+    from sparse_life import SparseGameOfLife
+    grid, h, v = random_case(26, density=0.1)
+    result = SparseGameOfLife(grid, h, v).simulate(5)
+    assert result.shape == grid.shape
+    save_array_to_image(result, str(tmp_path / "5.png"))
+    assert np.array_equal(load_binary_image_to_array(str(tmp_path / "5.png")), GameOfLifeWormhole(grid, h, v).simulate(5))
+
+
+@pytest.mark.parametrize("seed", [24, 25])
+def test_sparse_engine_name_matches_reference_random(seed):
+    grid, h, v = random_case(seed, density=0.1)
+    assert_engine_matches_reference("sparse", grid, h, v, steps=10)
+    expected = GameOfLifeWormhole(grid, h, v).simulate(10)
+    assert np.array_equal(GameOfLifeWormhole(grid, h, v, engine="sparse").simulate(10), expected)
+
+
+def test_sparse_board_far_too_large_to_densify():
+    from sparse_life import SparseGameOfLife
+    rows = cols = 1 << 20
+    glider = [(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)]
+    offset = 1 << 19
+    live = [(r + offset) * cols + (c + offset) for r, c in glider]
+    board = SparseGameOfLife.from_live_cells((rows, cols), live)
+    for _ in range(4):
+        board.step()
+    # A glider moves one cell down-right every 4 generations
+    assert board.live.tolist() == sorted((r + offset + 1) * cols + (c + offset + 1) for r, c in glider)
+    assert board.simulate_live(4).tolist() == sorted((r + offset + 2) * cols + (c + offset + 2) for r, c in glider)
+    assert board.simulate_live(8, detect_cycles=True).tolist() == sorted(
+        (r + offset + 4) * cols + (c + offset + 4) for r, c in glider
+    )
+
+    blinker = [offset * cols + offset + d for d in (-1, 0, 1)]
+    board = SparseGameOfLife.from_live_cells((rows, cols), blinker)
+    assert board.simulate_live(1001, detect_cycles=True).tolist() == sorted(offset * cols + offset + d * cols for d in (-1, 0, 1))
+    assert board.cycle_stats["period"] == 2 and board.cycle_stats["steps_computed"] < 10
+
+
+@pytest.mark.parametrize("seed,tile_size,depth", [(50, 8, 3), (51, 5, 4), (52, 16, 2)])
+def test_temporal_tiling_matches_table(seed, tile_size, depth):
+    from temporal_tiling import TemporalTiler
+    grid, h, v = random_case(seed, rows=60, cols=70, npairs=4)
+    gol = GameOfLifeWormhole(grid, h, v)
+    tiler = TemporalTiler(gol.rows, gol.cols, gol.compile_wormhole_corrections(), tile_size=tile_size, depth=depth)
+    plan = tiler._plan(depth)
+    assert plan.clean_tiles and plan.dirty_tiles
+    for generations in (1, depth, 2 * depth + 1):
+        expected = GameOfLifeWormhole(grid, h, v).simulate(generations)
+        assert np.array_equal(tiler.advance(grid, generations), expected), generations
+
+
+def test_temporal_engine_matches_table_on_data():
+    grid, h, v = load_case("example-2")
+    expected = GameOfLifeWormhole(grid, h, v).simulate(37)
+    gol = GameOfLifeWormhole(grid, h, v, engine="temporal")
+    gol.step()
+    assert np.array_equal(gol.simulate(36), expected)
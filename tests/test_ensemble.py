@@ -0,0 +1,55 @@
+import sys
+import os
+import numpy as np
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from game_of_life import GameOfLifeWormhole
+from ensemble import EnsembleGameOfLife, DIED, STILL, OSCILLATING, RUNNING
+from test_engines import random_case, random_wormholes
+
+
+def test_ensemble_matches_individual_runs():
+    grid, h, v = random_case(20)
+    rng = np.random.default_rng(20)
+    grids = rng.random((6,) + grid.shape) < np.linspace(0.05, 0.5, 6)[:, None, None]
+    checkpoints = [1, 5, 20, 60]
+
+    results = EnsembleGameOfLife(grids, h, v).simulate(checkpoints)
+    for member in range(len(grids)):
+        gol = GameOfLifeWormhole(grids[member], h, v)
+        prev = 0
+        for cp in checkpoints:
+            expected = gol.simulate(cp - prev)
+            prev = cp
+            assert np.array_equal(results[cp][member], expected), f"member {member} differs at {cp}"
+
+
+def test_ensemble_stops_settled_members_early():
+    rows, cols = 12, 12
+    grids = np.zeros((4, rows, cols), dtype=bool)
+    grids[1, 2:4, 2:4] = True          # block: still life
+    grids[2, 5, 4:7] = True            # blinker: period 2
+    grids[3, 0, 0] = True              # lone cell: dies
+    h = random_wormholes(np.random.default_rng(0), rows, cols, 0)
+
+    ens = EnsembleGameOfLife(grids, h, {})
+    results = ens.simulate("1,2,3,101")
+
+    assert list(ens.status) == [DIED, STILL, OSCILLATING, DIED]
+    assert ens.active.size == 0
+    assert list(ens.stopped_at) == [0, 1, 2, 1]
+    assert ens.generation == 101
+    assert np.array_equal(results[101][1], grids[1])
+    assert np.array_equal(results[101][2], grids[2].T)
+    assert np.array_equal(results[3][2], grids[2].T)
+    assert not results[101][3].any()
+
+
+def test_ensemble_keeps_running_members():
+    grid, h, v = random_case(21)
+    ens = EnsembleGameOfLife(grid[None], h, v)
+    ens.step()
+    assert ens.status[0] == RUNNING
+    assert np.array_equal(ens.grids[0], GameOfLifeWormhole(grid, h, v).simulate(1))
@@ -0,0 +1,91 @@
+import sys
+import os
+import numpy as np
+import pytest
+from PIL import Image, ImageSequence
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from game_of_life import GameOfLifeWormhole
+from history import GenerationHistory, apply_delta, encode_delta, write_gif, write_png_sequence
+from image_utils import load_binary_image_to_array
+from test_engines import random_case
+
+
+def recorded_run(generations, keyframe_interval=7, engine="table"):
+    grid, h, v = random_case(30)
+    gol = GameOfLifeWormhole(grid, h, v, engine=engine)
+    history = GenerationHistory(grid.shape, keyframe_interval)
+    expected = [grid.copy()]
+    for _ in range(generations):
+        expected.append(gol.simulate(1))
+    replay = GameOfLifeWormhole(grid, h, v, engine=engine)
+    replay.simulate(generations // 2, history=history)
+    replay.simulate(generations - generations // 2, history=history)
+    return history, expected
+
+
+def test_delta_round_trip():
+    rng = np.random.default_rng(1)
+    prev = np.packbits(rng.random(5000) < 0.3)
+    cur = prev.copy()
+    cur[[3, 4, 9, 300, 301, 620]] ^= 0xA5
+    packed = prev.copy()
+    apply_delta(packed, encode_delta(prev, cur))
+    assert np.array_equal(packed, cur)
+    starts, lengths, data = encode_delta(cur, cur)
+    assert starts.size == lengths.size == data.size == 0
+
+
+def test_history_seek_matches_simulation():
+    history, expected = recorded_run(40)
+    assert (history.first, history.last, len(history)) == (0, 40, 41)
+    for generation in [40, 0, 13, 14, 15, 7, 39, 21]:
+        assert np.array_equal(history.seek(generation), expected[generation]), generation
+    assert [g for g, _ in history.frames(5, 30, 5)] == [5, 10, 15, 20, 25, 30]
+    for generation, grid in history.frames(3):
+        assert np.array_equal(grid, expected[generation])
+    with pytest.raises(KeyError):
+        history.seek(41)
+
+
+def test_history_is_much_smaller_than_full_frames():
+    grid, h, v = random_case(32, rows=128, cols=128, density=0.05, npairs=20)
+    history = GenerationHistory(grid.shape)
+    GameOfLifeWormhole(grid, h, v).simulate(200, history=history)
+    full_frames = len(history) * np.packbits(grid).nbytes
+    assert history.nbytes * 4 < full_frames
+
+
+def test_history_records_with_cycle_detection_and_bitboard():
+    grid, h, v = random_case(31)
+    expected = GameOfLifeWormhole(grid, h, v).simulate(25)
+    for kwargs in ({"detect_cycles": True}, {}):
+        gol = GameOfLifeWormhole(grid, h, v, engine="bitboard")
+        history = GenerationHistory(grid.shape)
+        gol.simulate(25, history=history, **kwargs)
+        assert np.array_equal(history.seek(25), expected)
+
+
+def test_history_rejects_gaps():
+    history = GenerationHistory((4, 4))
+    history.record(0, np.zeros((4, 4), dtype=bool))
+    with pytest.raises(ValueError):
+        history.record(2, np.zeros((4, 4), dtype=bool))
+
+
+def test_streaming_exports(tmp_path):
+    history, expected = recorded_run(12, keyframe_interval=5)
+    path = str(tmp_path / "run.gif")
+    assert write_gif(history.frames(), path, duration_ms=50, scale=2) == 13
+
+    with Image.open(path) as gif:
+        frames = [np.array(frame.convert("L")) > 0 for frame in ImageSequence.Iterator(gif)]
+    assert len(frames) == 13
+    for frame, grid in zip(frames, expected):
+        assert np.array_equal(frame[::2, ::2], grid)
+
+    paths = write_png_sequence(history.frames(10, 12), str(tmp_path / "seq"))
+    assert [os.path.basename(p) for p in paths] == ["10.png", "11.png", "12.png"]
+    assert np.array_equal(load_binary_image_to_array(paths[-1]), expected[12])
@@ -0,0 +1,86 @@
+import sys
+import os
+import shutil
+import numpy as np
+import pytest
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from image_utils import (
+    RAW_HEADER_SIZE, RAW_PAGE_SIZE, load_binary_image_to_array, load_grid, load_raw_grid,
+    read_raw_header, save_array_to_image, save_raw_grid,
+)
+from convert_grids import convert
+from main import process_one_case
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+
+
+@pytest.mark.parametrize("encoding", ["uint8", "bits"])
+def test_raw_grid_round_trip(tmp_path, encoding):
+    grid = np.random.default_rng(0).random((37, 53)) < 0.4
+    path = str(tmp_path / "grid.raw")
+    save_raw_grid(grid, path, encoding)
+    assert read_raw_header(path) == (37, 53, encoding)
+    assert np.array_equal(load_raw_grid(path), grid)
+
+
+def test_uint8_raw_grid_loads_as_memmap(tmp_path):
+    grid = np.eye(64, dtype=bool)
+    path = str(tmp_path / "grid.raw")
+    save_raw_grid(grid, path)
+    loaded = load_raw_grid(path)
+    assert isinstance(loaded, np.memmap)
+    assert loaded.dtype == bool and np.array_equal(loaded, grid)
+
+
+def test_rewriting_raw_grid_only_touches_changed_pages(tmp_path):
+    grid = np.zeros((256, 256), dtype=bool)  # 16 pages of cells
+    path = str(tmp_path / "grid.raw")
+    assert save_raw_grid(grid, path) == 16
+    assert save_raw_grid(grid, path) == 0
+
+    grid[0, 0] = grid[200, 5] = True
+    assert save_raw_grid(grid, path) == 2
+    assert os.path.getsize(path) == RAW_HEADER_SIZE + 16 * RAW_PAGE_SIZE
+    assert np.array_equal(load_raw_grid(path), grid)
+
+    # A different shape or encoding rewrites the whole file
+    save_raw_grid(grid[:10], path, "bits")
+    assert np.array_equal(load_raw_grid(path), grid[:10])
+
+
+def test_raw_grid_rejects_other_files(tmp_path):
+    path = tmp_path / "grid.raw"
+    path.write_bytes(b"not a grid" * 10)
+    with pytest.raises(ValueError):
+        load_raw_grid(str(path))
+
+
+def test_convert_png_tree_to_raw_and_back(tmp_path):
+    case = tmp_path / "data" / "problem-4"
+    shutil.copytree(os.path.join(DATA_DIR, "problem-4"), case)
+    written = convert([str(tmp_path / "data")], "raw", encoding="bits")
+    assert written == [str(case / "starting_position.raw")]  # tunnel maps are skipped
+
+    expected = load_binary_image_to_array(str(case / "starting_position.png"))
+    assert np.array_equal(load_grid(str(case / "starting_position.raw")), expected)
+    os.remove(case / "starting_position.png")
+    convert([str(case / "starting_position.raw")], "png")
+    assert np.array_equal(load_binary_image_to_array(str(case / "starting_position.png")), expected)
+
+
+def test_process_one_case_reads_and_writes_raw(tmp_path):
+    data_dir = tmp_path / "data"
+    shutil.copytree(os.path.join(DATA_DIR, "problem-4"), data_dir / "problem-a")
+    process_one_case("problem-a", str(data_dir), str(tmp_path / "png"), checkpoints=[1, 10])
+
+    start = data_dir / "problem-a" / "starting_position.png"
+    save_raw_grid(load_binary_image_to_array(str(start)), str(start.with_suffix(".raw")))
+    save_array_to_image(np.zeros((1, 1), dtype=bool), str(start))  # raw input must take precedence
+    process_one_case("problem-a", str(data_dir), str(tmp_path / "raw"), checkpoints=[1, 10], grid_format="raw")
+
+    for cp in [1, 10]:
+        expected = load_binary_image_to_array(str(tmp_path / "png" / "problem-a" / f"{cp}.png"))
+        assert np.array_equal(load_raw_grid(str(tmp_path / "raw" / "problem-a" / f"{cp}.raw")), expected)
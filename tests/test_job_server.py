@@ -0,0 +1,109 @@
+import sys
+import os
+import asyncio
+import base64
+import numpy as np
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from game_of_life import GameOfLifeWormhole
+from image_utils import load_binary_image_to_array, load_color_image
+from job_server import JobServer, decode_result_grid, job_from_case, request
+from wormhole_parser import parse_wormholes_from_color_map
+
+CASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "problem-4"))
+
+
+def expected_grids(checkpoints):
+    grid = load_binary_image_to_array(os.path.join(CASE_DIR, "starting_position.png"))
+    h = parse_wormholes_from_color_map(load_color_image(os.path.join(CASE_DIR, "horizontal_tunnel.png")))
+    v = parse_wormholes_from_color_map(load_color_image(os.path.join(CASE_DIR, "vertical_tunnel.png")))
+    gol = GameOfLifeWormhole(grid, h, v)
+    out, prev = {}, 0
+    for cp in checkpoints:
+        out[cp] = gol.simulate(cp - prev)
+        prev = cp
+    return out
+
+
+def test_jobs_run_cache_and_deduplicate():
+    async def scenario():
+        async with JobServer(workers=1) as server:
+            host, port = await server.start()
+            body = job_from_case(CASE_DIR, checkpoints=[1, 10, 50])
+            # Three identical jobs at once: one run, two waiting on it
+            responses = await asyncio.gather(*(request("POST", "/jobs", body, host, port) for _ in range(3)))
+            cached = await request("POST", "/jobs", body, host, port)
+            packed = await request("POST", "/jobs", dict(body, encoding="packed"), host, port)
+            forced = await request("POST", "/jobs", dict(body, engine="stencil"), host, port)
+            stats = await request("GET", "/stats", host=host, port=port)
+        return responses, cached, packed, forced, stats
+
+    responses, cached, packed, forced, (_, stats) = asyncio.run(scenario())
+    assert [status for status, _ in responses] == [200, 200, 200]
+    assert sorted(r["source"] for _, r in responses) == ["deduplicated", "deduplicated", "run"]
+    assert cached[1]["source"] == "cache" and cached[1]["job"] == responses[0][1]["job"]
+    # A different encoding is a different job, but the worker's topology is warm by then
+    assert packed[1]["source"] == "run" and packed[1]["worker"]["topology"] == "warm"
+    # Forcing an engine is a different job too
+    assert forced[1]["source"] == "run" and forced[1]["engine"] == "stencil"
+    assert stats["runs"] == 3 and stats["deduplicated"] == 2 and stats["cache_hits"] == 1
+
+    expected = expected_grids([1, 10, 50])
+    for _, result in (responses[0], packed, forced):
+        assert result["timing"]["total_seconds"] >= 0 and result["timing"]["run_seconds"] > 0
+        for cp, grid in expected.items():
+            assert np.array_equal(decode_result_grid(result, cp), grid)
+
+
+def test_queue_limit_and_bad_requests(tmp_path):
+    async def scenario():
+        async with JobServer(workers=1, max_queue=1) as server:
+            unix_path = str(tmp_path / "jobs.sock")
+            await server.start(unix_path=unix_path)
+            slow = job_from_case(CASE_DIR, checkpoints=[1000], detect_cycles=False, engine="table")
+            running = asyncio.ensure_future(request("POST", "/jobs", slow, unix_path=unix_path))
+            while server.queue_depth == 0:
+                await asyncio.sleep(0.01)
+            rejected = await request("POST", "/jobs", dict(slow, checkpoints=[999]), unix_path=unix_path)
+            bad = await request("POST", "/jobs", {"starting_position": "??"}, unix_path=unix_path)
+            bad_engine = await request("POST", "/jobs", dict(slow, engine="fastest"), unix_path=unix_path)
+            missing = await request("GET", "/nope", unix_path=unix_path)
+            return await running, rejected, bad, bad_engine, missing
+
+    running, rejected, bad, bad_engine, missing = asyncio.run(scenario())
+    assert running[0] == 200
+    assert rejected[0] == 503 and "Queue full" in rejected[1]["error"]
+    assert bad[0] == 400
+    assert bad_engine[0] == 400 and "engine" in bad_engine[1]["error"]
+    assert missing[0] == 404
+
+
+def test_client_errors_are_400_not_500():
+    async def raw(host, port, head):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(head)
+        writer.write_eof()
+        response = await reader.read()
+        writer.close()
+        return int(response.split()[1])
+
+    async def scenario():
+        async with JobServer(workers=1) as server:
+            host, port = await server.start()
+            statuses = [
+                await raw(host, port, b"POST /jobs HTTP/1.1\r\nContent-Length: abc\r\n\r\n"),
+                await raw(host, port, b"POST /jobs HTTP/1.1\r\nContent-Length: -5\r\n\r\n"),
+                await raw(host, port, b"POST /jobs HTTP/1.1\r\nContent-Length: 10\r\n\r\n{}"),
+            ]
+            body = job_from_case(CASE_DIR, checkpoints=[1])
+            body["horizontal_tunnel"] = base64.b64encode(b"\x89PNG\r\n\x1a\n not really").decode("ascii")
+            not_png = await request("POST", "/jobs", body, host, port)
+            stats = await request("GET", "/stats", host=host, port=port)
+        return statuses, not_png, stats
+
+    statuses, not_png, (_, stats) = asyncio.run(scenario())
+    assert statuses == [400, 400, 400]
+    assert not_png[0] == 400 and "horizontal_tunnel" in not_png[1]["error"]
+    assert stats["failed"] == 0 and stats["runs"] == 0
@@ -0,0 +1,75 @@
+import sys
+import os
+import shutil
+import numpy as np
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from image_utils import load_binary_image_to_array
+from main import process_one_case, run_cases_parallel
+from metrics import RunMetrics
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+
+
+def make_data_dir(tmp_path, cases):
+    data_dir = tmp_path / "data"
+    for name in cases:
+        shutil.copytree(os.path.join(DATA_DIR, "problem-4"), data_dir / name)
+    return data_dir
+
+
+def test_parallel_runner_matches_serial_and_skips_missing(tmp_path):
+    data_dir = make_data_dir(tmp_path, ["problem-b", "problem-a"])
+    (data_dir / "problem-c").mkdir()
+    serial_dir = tmp_path / "serial"
+    parallel_dir = tmp_path / "parallel"
+
+    process_one_case("problem-a", str(data_dir), str(serial_dir))
+    results = run_cases_parallel(["problem-a", "problem-b", "problem-c"], str(data_dir), str(parallel_dir), workers=2)
+
+    assert [(name, status) for name, status, _, _, _ in results] == [
+        ("problem-a", "ok"),
+        ("problem-b", "ok"),
+        ("problem-c", "skipped"),
+    ]
+    for cp in [1, 10, 100, 1000]:
+        expected = load_binary_image_to_array(str(serial_dir / "problem-a" / f"{cp}.png"))
+        for name in ["problem-a", "problem-b"]:
+            got = load_binary_image_to_array(str(parallel_dir / name / f"{cp}.png"))
+            assert np.array_equal(got, expected)
+
+
+def test_process_one_case_records_metrics(tmp_path):
+    data_dir = make_data_dir(tmp_path, ["problem-a"])
+    metrics = RunMetrics()
+    process_one_case("problem-a", str(data_dir), str(tmp_path / "out"), checkpoints=[1, 10], metrics=metrics)
+    report = metrics.to_dict()
+
+    for phase in ("decode", "decode_tunnels", "parse", "step", "encode", "wait_for_writer"):
+        assert report["phases"][phase] >= 0
+    assert report["counters"]["generations"] == 10
+    assert report["counters"]["h_portal_cells"] > 0
+    assert [cp["generation"] for cp in report["checkpoints"]] == [1, 10]
+    grid = load_binary_image_to_array(str(tmp_path / "out" / "problem-a" / "10.png"))
+    assert report["checkpoints"][-1]["live_cells"] == int(grid.sum())
+    assert report["generations_per_second"] > 0
+
+
+def test_warm_topology_cache_skips_all_teleport_resolution(tmp_path, monkeypatch):
+    from game_of_life import GameOfLifeWormhole
+    data_dir = make_data_dir(tmp_path, ["problem-a"])
+    cache_dir = str(tmp_path / "cache")
+    process_one_case("problem-a", str(data_dir), str(tmp_path / "cold"), cache_dir=cache_dir, checkpoints=[1, 10])
+
+    def no_teleport(*args):
+        raise AssertionError("warm run resolved a teleport")
+
+    monkeypatch.setattr(GameOfLifeWormhole, "teleport", no_teleport)
+    for engine in ("auto", "table", "stencil", "bitboard"):
+        out_dir = tmp_path / engine
+        process_one_case("problem-a", str(data_dir), str(out_dir), cache_dir=cache_dir, checkpoints=[1, 10], engine=engine)
+        for cp in [1, 10]:
+            expected = load_binary_image_to_array(str(tmp_path / "cold" / "problem-a" / f"{cp}.png"))
+            assert np.array_equal(load_binary_image_to_array(str(out_dir / "problem-a" / f"{cp}.png")), expected)
@@ -0,0 +1,71 @@
+import sys
+import os
+import shutil
+import numpy as np
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from game_of_life import GameOfLifeWormhole
+from image_utils import load_binary_image_to_array
+from main import process_one_case
+from metrics import RunMetrics
+from snapshots import RunSnapshots
+from test_engines import random_case
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+
+
+def test_simulate_saves_snapshots_and_resumes(tmp_path):
+    grid, h, v = random_case(40)
+    expected = GameOfLifeWormhole(grid, h, v).simulate(57)
+
+    snapshots = RunSnapshots(str(tmp_path), grid, h, v, interval=10, verbose=False)
+    GameOfLifeWormhole(grid, h, v).simulate(35, snapshots=snapshots)
+    assert snapshots.generations() == [10, 20, 30]
+
+    gol = GameOfLifeWormhole(grid, h, v, engine="bitboard")
+    assert snapshots.resume(gol) == 30
+    assert np.array_equal(gol.simulate(27, snapshots=snapshots), expected)
+    assert snapshots.generations() == [10, 20, 30, 40, 50]
+
+    # Other inputs never see these snapshots
+    other = RunSnapshots(str(tmp_path), grid, h, {}, interval=10, verbose=False)
+    assert other.latest() == (0, None)
+
+
+def test_torn_or_foreign_snapshots_are_dropped(tmp_path):
+    grid, h, v = random_case(41)
+    snapshots = RunSnapshots(str(tmp_path), grid, h, v, interval=5, verbose=False)
+    GameOfLifeWormhole(grid, h, v).simulate(15, snapshots=snapshots)
+    with open(os.path.join(snapshots.directory, "15.npz"), "r+b") as f:
+        f.truncate(40)
+    shutil.copy(os.path.join(snapshots.directory, "5.npz"), os.path.join(snapshots.directory, "20.npz"))
+    open(os.path.join(snapshots.directory, "tmpabc.tmp"), "wb").close()  # left by a crash mid-write
+
+    generation, restored = snapshots.latest()
+    assert generation == 10
+    assert np.array_equal(restored, GameOfLifeWormhole(grid, h, v).simulate(10))
+    assert snapshots.generations() == [5, 10]
+
+
+def test_process_one_case_resumes_longer_run(tmp_path):
+    data_dir = tmp_path / "data"
+    shutil.copytree(os.path.join(DATA_DIR, "problem-4"), data_dir / "problem-a")
+    snapshot_dir = str(tmp_path / "snapshots")
+    process_one_case("problem-a", str(data_dir), str(tmp_path / "fresh"), checkpoints=[1, 10, 250],
+                     detect_cycles=False)
+
+    process_one_case("problem-a", str(data_dir), str(tmp_path / "first"), checkpoints=[1, 10, 100],
+                     snapshot_dir=snapshot_dir, snapshot_interval=40)
+    metrics = RunMetrics()
+    process_one_case("problem-a", str(data_dir), str(tmp_path / "resumed"), checkpoints=[1, 10, 250],
+                     snapshot_dir=snapshot_dir, snapshot_interval=40, metrics=metrics, detect_cycles=False)
+
+    report = metrics.to_dict()
+    assert report["counters"]["resumed_from"] == 100
+    assert report["counters"]["generations"] == 150
+    for cp in [1, 10, 250]:
+        expected = load_binary_image_to_array(str(tmp_path / "fresh" / "problem-a" / f"{cp}.png"))
+        got = load_binary_image_to_array(str(tmp_path / "resumed" / "problem-a" / f"{cp}.png"))
+        assert np.array_equal(got, expected)
@@ -0,0 +1,30 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from wormhole_parser import parse_wormholes_from_color_map
+from synthetic import random_grid, random_tunnel_map
+
+
+def test_random_grid_density_and_seed():
+    grid = random_grid(200, 100, density=0.25, seed=3)
+    assert grid.shape == (200, 100) and grid.dtype == bool
+    assert abs(grid.mean() - 0.25) < 0.02
+    assert np.array_equal(grid, random_grid(200, 100, density=0.25, seed=3))
+
+
+@pytest.mark.parametrize("portals,size", [(1, 1), (40, 1), (15, 3)])
+def test_random_tunnel_map_parses_every_portal(portals, size, capsys):
+    arr = random_tunnel_map(60, 70, portals, portal_size=size, seed=portals)
+    holes = parse_wormholes_from_color_map(arr)
+    assert capsys.readouterr().out == ""
+    assert len(holes) == 2 * portals * size * size
+
+
+def test_random_tunnel_map_rejects_overfull_map():
+    with pytest.raises(ValueError):
+        random_tunnel_map(4, 4, portals=3)
@@ -0,0 +1,85 @@
+import sys
+import os
+import shutil
+import numpy as np
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from game_of_life import GameOfLifeWormhole
+from topology_cache import TopologyCache, load_topology
+
+CASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "example-2"))
+H_PATH = os.path.join(CASE_DIR, "horizontal_tunnel.png")
+V_PATH = os.path.join(CASE_DIR, "vertical_tunnel.png")
+SHAPE = (45, 62)
+
+
+def test_warm_load_matches_cold_parse(tmp_path):
+    h, v, table, corrections = load_topology(H_PATH, V_PATH, SHAPE)
+    assert table is None and corrections is None
+
+    cache = TopologyCache(str(tmp_path), verbose=False)
+    cold = load_topology(H_PATH, V_PATH, SHAPE, cache)
+    warm = load_topology(H_PATH, V_PATH, SHAPE, cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    for got in (cold, warm):
+        assert got[0] == h and got[1] == v
+        topology = GameOfLifeWormhole(np.zeros(SHAPE, dtype=bool), h, v)
+        assert np.array_equal(got[2], topology.compile_neighbor_table())
+        for part, expected in zip(got[3], topology.compile_wormhole_corrections()):
+            assert np.array_equal(part, expected) and part.dtype == expected.dtype
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_key_depends_on_image_bytes_and_shape(tmp_path):
+    cache = TopologyCache(str(tmp_path / "cache"), verbose=False)
+    other_v = str(tmp_path / "v.png")
+    shutil.copy(H_PATH, other_v)
+    base = cache.key_for(H_PATH, V_PATH, SHAPE)
+    assert cache.key_for(H_PATH, V_PATH, SHAPE) == base
+    assert cache.key_for(H_PATH, other_v, SHAPE) != base
+    assert cache.key_for(H_PATH, V_PATH, (SHAPE[0], SHAPE[1] + 1)) != base
+
+
+def test_unreadable_entry_is_dropped(tmp_path):
+    cache = TopologyCache(str(tmp_path), verbose=False)
+    key = cache.key_for(H_PATH, V_PATH, SHAPE)
+    (tmp_path / f"{key}.npz").write_bytes(b"not a zip file")
+    assert cache.load(key) is None
+    assert not (tmp_path / f"{key}.npz").exists()
+
+
+def test_eviction_keeps_cache_under_budget(tmp_path):
+    cache = TopologyCache(str(tmp_path), max_bytes=1, verbose=False)
+    h, v, table, corrections = load_topology(H_PATH, V_PATH, SHAPE, cache)
+    assert os.listdir(tmp_path) == []
+    cache.max_bytes = 10 * table.nbytes
+    cache.store("a" * 64, h, v, table, corrections)
+    cache.store("b" * 64, h, v, table, corrections)
+    assert sorted(os.listdir(tmp_path)) == ["a" * 64 + ".npz", "b" * 64 + ".npz"]
+
+
+def test_entry_over_budget_is_not_stored(tmp_path, capsys):
+    cache = TopologyCache(str(tmp_path), max_bytes=1)
+    load_topology(H_PATH, V_PATH, SHAPE, cache)
+    assert os.listdir(tmp_path) == []
+    out = capsys.readouterr().out
+    assert "not storing" in out and "evicted" not in out
+
+
+def test_hit_survives_concurrent_eviction(tmp_path, monkeypatch):
+    cache = TopologyCache(str(tmp_path), verbose=False)
+    cold = load_topology(H_PATH, V_PATH, SHAPE, cache)
+    key = cache.key_for(H_PATH, V_PATH, SHAPE)
+
+    def evicted(path):
+        os.remove(path)
+        raise FileNotFoundError(path)
+
+    # Another process evicts the entry between np.load and the mtime refresh
+    monkeypatch.setattr(os, "utime", evicted)
+    warm = cache.load(key)
+    assert warm is not None and cache.hits == 1
+    assert np.array_equal(warm[2], cold[2])
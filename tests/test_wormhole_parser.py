@@ -0,0 +1,52 @@
+import sys
+import os
+import numpy as np
+import pytest
+
+# Add ../srcs to sys.path so we can import from it cleanly
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../srcs")))
+
+from image_utils import load_color_image
+from wormhole_parser import parse_wormholes_from_color_map, _parse_wormholes_bfs
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data"))
+CASES = sorted(name for name in os.listdir(DATA_DIR) if os.path.isdir(os.path.join(DATA_DIR, name)))
+
+
+def assert_same_as_bfs(arr, capsys):
+    expected = _parse_wormholes_bfs(arr)
+    expected_out = capsys.readouterr().out
+    result = parse_wormholes_from_color_map(arr)
+    assert capsys.readouterr().out == expected_out
+    assert result == expected
+    assert list(result.items()) == list(expected.items())
+
+
+@pytest.mark.parametrize("case_name", CASES)
+@pytest.mark.parametrize("tunnel", ["horizontal_tunnel.png", "vertical_tunnel.png"])
+def test_matches_bfs_on_data(case_name, tunnel, capsys):
+    assert_same_as_bfs(load_color_image(os.path.join(DATA_DIR, case_name, tunnel)), capsys)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_matches_bfs_on_random_blobs(seed, capsys):
+    # Few colors on a dense board: many odd counts, size mismatches and
+    # irregular 8-connected shapes
+    rng = np.random.default_rng(seed)
+    palette = np.array([[0, 0, 0], [255, 0, 0], [0, 255, 0], [0, 0, 255], [9, 9, 9]], dtype=np.uint8)
+    arr = palette[rng.choice(len(palette), size=(40, 50), p=[0.7, 0.1, 0.1, 0.05, 0.05])]
+    assert_same_as_bfs(arr, capsys)
+
+
+def test_pairs_same_sized_components():
+    arr = np.zeros((6, 8, 3), dtype=np.uint8)
+    arr[1, 1:3] = [10, 20, 30]
+    arr[4, 5:7] = [10, 20, 30]
+    assert parse_wormholes_from_color_map(arr) == {
+        (1, 1): (4, 5), (4, 5): (1, 1),
+        (1, 2): (4, 6), (4, 6): (1, 2),
+    }
+
+
+def test_black_map_has_no_wormholes():
+    assert parse_wormholes_from_color_map(np.zeros((4, 4, 3), dtype=np.uint8)) == {}
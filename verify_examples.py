@@ -1,5 +1,6 @@
 # File: verify_examples.py
 
+import argparse
 import os
 import sys
 import numpy as np
@@ -13,7 +14,7 @@ sys.path.insert(0, SRC_DIR)
 from main import process_one_case
 from image_utils import load_binary_image_to_array, save_array_to_image
 from wormhole_parser import parse_wormholes_from_color_map
-from game_of_life import GameOfLifeWormhole
+from game_of_life import ENGINES, GameOfLifeWormhole
 
 DATA_DIR      = os.path.join(PROJECT_ROOT, "data")
 OUTPUT_EX_DIR = os.path.join(PROJECT_ROOT, "output_examples")
@@ -27,6 +28,13 @@ def compare_grids(A: np.ndarray, B: np.ndarray):
     mismatches = int(np.count_nonzero(diff))
     return (mismatches, A.size), None
 
+parser = argparse.ArgumentParser(description="Simulate the example-* cases and compare them with their expected PNGs.")
+parser.add_argument(
+    "--engine", choices=("auto",) + ENGINES, default="auto",
+    help="stepping engine to verify; auto lets the planner choose per case",
+)
+args = parser.parse_args()
+
 os.makedirs(OUTPUT_EX_DIR, exist_ok=True)
 example_folders = sorted(
     name for name in os.listdir(DATA_DIR)
@@ -45,7 +53,7 @@ for ex in example_folders:
 
     # 1) Simulate example-*
     try:
-        process_one_case(ex, DATA_DIR, OUTPUT_EX_DIR)
+        process_one_case(ex, DATA_DIR, OUTPUT_EX_DIR, engine=args.engine)
     except Exception as e:
         print(f"  [ERROR] Simulation failed for {ex}: {e}")
         all_good = False